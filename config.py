@@ -134,6 +134,8 @@ __all__ = [
     'EMBEDDING_MODEL', 'EMBEDDING_DIM', 'BATCH_SIZE',
     'PDF_COLLECTION', 'JSONL_COLLECTION', 'JSONL_COLLECTION_CLEANED', 
     'JSONL_COLLECTION_ORIGINAL', 'DEFAULT_SEARCH_LIMIT',
+    # Data migration configuration
+    'MIGRATION_LARGE_COPY_BUFFER',
     # Configuration constants
     'LOG_LEVEL', 'LOG_NAME', 'DEFAULT_DATASET_NAME',
     # Public functions
@@ -350,6 +352,18 @@ DEFAULT_SEARCH_LIMIT = 10
 """Default number of results to return from vector search."""
 
 
+# ============================================================================
+# DATA MIGRATION CONFIGURATION
+# ============================================================================
+
+MIGRATION_LARGE_COPY_BUFFER = True
+"""
+Use a 16 MiB copy buffer for data migration on Windows, where shutil copies
+through a userspace buffer (1 MiB by default) instead of a kernel fast path.
+Disable on memory-constrained systems, since every copy thread allocates one.
+"""
+
+
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -6,6 +6,7 @@ featuring:
 - Thread-safe singleton logger initialization
 - Organized log folder structure by module category (RAG, data_cleaning, main)
 - Log rotation with configurable file size and backup count
+- Buffered log file writes flushed in the background, not per record
 - Multiple output formats (text, JSON for monitoring integration)
 - Convenience functions for quick logging (debug, info, success, error, etc.)
 - Decorators for automatic error and timing logging
@@ -26,6 +27,12 @@ Thread Safety:
     Logger initialization uses double-check locking pattern for thread-safe
     singleton creation without unnecessary locking overhead.
 
+Asynchronous Output:
+    The 'reportalin' logger only carries a QueueHandler. A background
+    QueueListener thread owns the real file and console handlers, so log
+    calls never block on disk I/O. The listener is drained at interpreter
+    exit and by reset_logging().
+
 Log Organization:
     Logs are organized into categories based on module name:
     - data_cleaning_and_processing: Data preparation modules
@@ -72,11 +79,14 @@ Note:
     for convenient SUCCESS-level logging on any logger instance.
 """
 
+import atexit
+import copy
 import functools
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 import threading
 import time
@@ -117,19 +127,26 @@ __all__ = [
     
     # Classes
     'VerboseLogger',
-    'CustomFormatter',
     'JSONFormatter',
+    'BufferedRotatingFileHandler',
+    'RecordQueueHandler',
 ]
 
-# Custom SUCCESS level
+# Custom SUCCESS level. Registering the name means every LogRecord at level 25
+# gets levelname "SUCCESS", so plain logging.Formatter handles it.
 SUCCESS = 25
 logging.addLevelName(SUCCESS, "SUCCESS")
 
 # Global configuration
 _logger: Optional[logging.Logger] = None
 _log_file_path: Optional[str] = None
+_log_file_suffix = ''  # "\nFor more details, ..." text appended by include_log_path
+_log_listener: Optional[logging.handlers.QueueListener] = None
 _logger_lock = threading.Lock()
 
+# Pre-built VerboseLogger indent prefixes, indexed by nesting depth
+_INDENTS = tuple("  " * depth for depth in range(32))
+
 # Module to category mapping for organized log structure
 MODULE_CATEGORY_MAP = {
     # Data Cleaning and Processing
@@ -152,57 +169,6 @@ MODULE_CATEGORY_MAP = {
 }
 
 
-class CustomFormatter(logging.Formatter):
-    """Enhanced formatter with SUCCESS level support and optional colors.
-    
-    This formatter extends the standard logging.Formatter to properly handle
-    the custom SUCCESS log level (25). It ensures SUCCESS messages are
-    displayed with the correct level name.
-    
-    The formatter respects the format string passed during initialization
-    and applies standard timestamp, logger name, and message formatting.
-    
-    Attributes:
-        Inherits all attributes from logging.Formatter.
-    
-    Example:
-        >>> formatter = CustomFormatter('%(levelname)s: %(message)s')
-        >>> handler = logging.StreamHandler()
-        >>> handler.setFormatter(formatter)
-        >>> logger.addHandler(handler)
-        >>> logger.log(SUCCESS, "Operation completed")
-        SUCCESS: Operation completed
-    """
-    
-    def format(self, record: logging.LogRecord) -> str:
-        """Format the log record with proper SUCCESS level handling.
-        
-        Overrides the base format method to ensure records at the SUCCESS
-        level (25) display "SUCCESS" as the level name instead of a numeric
-        value or default name.
-        
-        Args:
-            record: The log record to format, containing message, level,
-                timestamp, and other metadata.
-        
-        Returns:
-            The formatted log message as a string, ready for output to
-            file or console.
-        
-        Example:
-            >>> record = logging.LogRecord(
-            ...     name="test", level=SUCCESS, pathname="", lineno=0,
-            ...     msg="Done", args=(), exc_info=None
-            ... )
-            >>> formatter = CustomFormatter('%(levelname)s: %(message)s')
-            >>> formatter.format(record)
-            'SUCCESS: Done'
-        """
-        if record.levelno == SUCCESS:
-            record.levelname = "SUCCESS"
-        return super().format(record)
-
-
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging (monitoring tools integration).
     
@@ -290,6 +256,99 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_data)
 
 
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that batches writes instead of flushing per record.
+
+    The stock RotatingFileHandler flushes the stream after every record and
+    seeks to the end of the file before every write to decide on rollover,
+    which costs at least one write() syscall per log call. This handler opens
+    the file with a large write buffer, tracks the file size itself, and
+    leaves flushing to a background timer (every flush_interval seconds) and
+    to close(), which logging.shutdown() calls at interpreter exit.
+
+    Args:
+        *args: Positional arguments for RotatingFileHandler (filename, mode,
+            maxBytes, backupCount, ...).
+        buffer_size: Size of the underlying write buffer in bytes
+            (default: 64KB).
+        flush_interval: Seconds between background flushes (default: 0.5).
+        **kwargs: Keyword arguments for RotatingFileHandler.
+
+    Example:
+        >>> handler = BufferedRotatingFileHandler(
+        ...     'app.log', maxBytes=10 * 1024 * 1024, backupCount=5,
+        ...     encoding='utf-8'
+        ... )
+        >>> logger.addHandler(handler)
+
+    Note:
+        Records written within the last flush_interval seconds may be lost
+        if the process is killed without running atexit handlers. File size
+        for rollover is measured in characters, matching the approximation
+        used by RotatingFileHandler.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 0.5,
+        **kwargs: Any
+    ) -> None:
+        self._buffer_size = buffer_size
+        self._bytes_written = 0
+        super().__init__(*args, **kwargs)
+        self._flush_stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            args=(flush_interval,),
+            name='reportalin-log-flush',
+            daemon=True
+        )
+        self._flusher.start()
+
+    def _open(self):
+        """Open the log file with a large write buffer and record its size."""
+        stream = open(
+            self.baseFilename, self.mode, buffering=self._buffer_size,
+            encoding=self.encoding, errors=self.errors
+        )
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def _flush_periodically(self, interval: float) -> None:
+        """Flush buffered records every interval seconds until closed."""
+        while not self._flush_stop.wait(interval):
+            self.flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record to the buffer, rolling over first if needed.
+
+        Args:
+            record: The log record to write.
+        """
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if (self.maxBytes > 0 and self._bytes_written
+                    and self._bytes_written + len(msg) >= self.maxBytes):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._bytes_written += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Stop the background flusher, then flush and close the file."""
+        self._flush_stop.set()
+        super().close()
+
+
 def _get_log_category(module_name: str) -> str:
     """Determine log category (folder) based on module name.
     
@@ -335,6 +394,23 @@ def _get_log_category(module_name: str) -> str:
     return 'main'
 
 
+@functools.lru_cache(maxsize=None)
+def _base_log_dir(logs_root: str) -> Path:
+    """Return the RePORTaLiN log directory under logs_root.
+    
+    Cached per root so repeated setups and cleanups reuse one Path object
+    instead of rebuilding it. The root is passed in (rather than read here)
+    so a changed LOG_DIR environment variable is still honoured.
+    
+    Args:
+        logs_root: Root directory for logs, usually the LOG_DIR value.
+    
+    Returns:
+        Path to '<logs_root>/RePORTaLiN'.
+    """
+    return Path(logs_root) / 'RePORTaLiN'
+
+
 def _get_log_directory(category: str, base_dir: Optional[Path] = None, use_category: bool = True) -> Path:
     """Get the log directory path for a given category.
     
@@ -356,7 +432,8 @@ def _get_log_directory(category: str, base_dir: Optional[Path] = None, use_categ
     
     Side Effects:
         Creates the log directory and all parent directories if they don't
-        exist (using mkdir with parents=True, exist_ok=True).
+        exist (using mkdir with parents=True, exist_ok=True). An existing
+        directory costs a single stat call.
     
     Example:
         >>> log_dir = _get_log_directory('RAG/data_ingestion', use_category=True)
@@ -373,16 +450,44 @@ def _get_log_directory(category: str, base_dir: Optional[Path] = None, use_categ
     """
     if base_dir is None:
         # Get base directory from environment or use default
-        logs_root = os.getenv('LOG_DIR', '.logs')
-        base_dir = Path(logs_root) / 'RePORTaLiN'
+        base_dir = _base_log_dir(os.getenv('LOG_DIR', '.logs'))
     
     # In verbose mode, use category-based folder structure
     # In default mode, use single main directory
     log_dir = base_dir / category if use_category else base_dir
-    log_dir.mkdir(parents=True, exist_ok=True)
+    # A single stat is cheaper than mkdir's failed syscall plus stat
+    if not log_dir.is_dir():
+        log_dir.mkdir(parents=True, exist_ok=True)
     return log_dir
 
 
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves exception details for the listener's formatters.
+
+    The stock prepare() formats the whole record, traceback included, into
+    record.msg and clears exc_info, which suits queues read by another
+    process. Here the listener runs in the same process, so only the message
+    arguments are resolved (freezing their values at call time) and
+    exc_info/stack_info are kept. The formatters on the listener side
+    therefore see the same record as a directly attached handler would:
+    JSONFormatter still emits a separate 'exception' field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a copy of the record with its message arguments merged.
+
+        Args:
+            record: The log record to enqueue.
+
+        Returns:
+            Shallow copy of record with msg resolved and args cleared.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 def setup_logging(
     module_name: str = '__main__',
     log_level: Optional[str] = None,
@@ -443,8 +548,12 @@ def setup_logging(
         - Creates log directory structure under .logs/RePORTaLiN/ (or LOG_DIR)
         - Creates timestamped log file with rotation handlers
         - Configures console and file handlers with appropriate formatters
+        - Starts a background QueueListener thread that owns those handlers;
+          the logger itself only holds a QueueHandler
+        - Queued records are drained at interpreter exit via an atexit hook
         - Adds custom 'success' method to logging.Logger class
-        - Sets global _logger and _log_file_path variables
+        - Sets global _logger, _log_file_path and _log_listener variables
+        - Binds the convenience functions (info, error, ...) to the logger
     
     Raises:
         OSError: If log directory cannot be created due to permissions.
@@ -487,7 +596,7 @@ def setup_logging(
         overwriting previous runs. Rotation creates numbered backups
         (e.g., app.log.1, app.log.2, etc.).
     """
-    global _logger, _log_file_path
+    global _logger, _log_file_path, _log_file_suffix, _log_listener
     
     # Fast path: return existing logger without lock
     if _logger is not None:
@@ -523,7 +632,11 @@ def setup_logging(
     log_dir = _get_log_directory(category, use_category=verbose)
     
     # Create timestamped log filename (ALWAYS includes date and time)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = (
+        f"{now.year:04d}{now.month:02d}{now.day:02d}_"
+        f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
+    )
     
     if verbose:
         # Verbose mode: Use module-specific name
@@ -533,10 +646,11 @@ def setup_logging(
         # Default mode: Use single main log file with timestamp
         log_file = log_dir / f"reportalin_{timestamp}.log"
     
-    _log_file_path = str(log_file)
+    _log_file_path = os.fspath(log_file)
+    _log_file_suffix = f"\nFor more details, check the log file at: {_log_file_path}"
     
-    # File handler with rotation
-    file_handler = logging.handlers.RotatingFileHandler(
+    # Buffered file handler with rotation (flushed by a timer, not per record)
+    file_handler = BufferedRotatingFileHandler(
         log_file,
         maxBytes=max_bytes,
         backupCount=backup_count,
@@ -558,7 +672,7 @@ def setup_logging(
         else:
             format_str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         
-        file_formatter = CustomFormatter(format_str)
+        file_formatter = logging.Formatter(format_str)
     
     file_handler.setFormatter(file_formatter)
     
@@ -568,7 +682,7 @@ def setup_logging(
     if simple_mode:
         # Simple mode: only show SUCCESS, WARNING, ERROR, and CRITICAL
         console_handler.setLevel(logging.WARNING)
-        console_handler.setFormatter(CustomFormatter('%(levelname)s: %(message)s'))
+        console_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
         
         class SimpleFilter(logging.Filter):
             """Allow SUCCESS (25), WARNING (30), ERROR (40), and CRITICAL (50)."""
@@ -579,7 +693,7 @@ def setup_logging(
     else:
         # Default mode: Show only SUCCESS, ERROR, and CRITICAL
         console_handler.setLevel(logging.ERROR)
-        console_handler.setFormatter(CustomFormatter('%(levelname)s: %(message)s'))
+        console_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
         
         class SuccessOrErrorFilter(logging.Filter):
             """Allow SUCCESS (25), ERROR (40), and CRITICAL (50)."""
@@ -588,28 +702,73 @@ def setup_logging(
         
         console_handler.addFilter(SuccessOrErrorFilter())
     
-    _logger.addHandler(file_handler)
-    _logger.addHandler(console_handler)
+    # Hand records to a background listener so callers never wait on I/O.
+    # respect_handler_level keeps the per-handler levels and filters intact.
+    log_queue: queue.Queue = queue.Queue(-1)
+    _logger.addHandler(RecordQueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _log_listener.start()
     
     # Log initialization with mode info
     mode = "verbose" if verbose else "default"
     _logger.info(f"Logging initialized. Mode: {mode}, Category: {category}, Log file: {log_file}")
     
+    _bind_logger_methods(_logger)
+    
     return _logger
 
 
+def _verbose_enabled() -> bool:
+    """Return True if the active logger currently emits DEBUG records.
+    
+    Reads the live level, so get_logger().setLevel() after setup_logging()
+    turns VerboseLogger output on or off. Logger.isEnabledFor() caches its
+    answer and the cache is cleared on every level change, so this stays
+    cheap enough for per-item guards.
+    
+    Returns:
+        False before setup_logging() or after reset_logging().
+    """
+    return _logger is not None and _logger.isEnabledFor(logging.DEBUG)
+
+
+def _stop_listener() -> None:
+    """Drain the log queue and stop the background listener thread.
+    
+    Registered with atexit by setup_logging() so queued records are written
+    before the interpreter exits. Safe to call more than once.
+    """
+    global _log_listener
+    
+    listener = _log_listener
+    if listener is None:
+        return
+    _log_listener = None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(_stop_listener)
+
+
 def reset_logging() -> None:
     """Reset logging configuration.
     
-    Closes all handlers, removes them from the logger, and resets the global
-    logger and log file path variables. This is primarily used for testing
-    or when you need to reinitialize logging with different settings.
+    Stops the background listener, closes all handlers, removes them from
+    the logger, and resets the global logger and log file path variables.
+    This is primarily used for testing or when you need to reinitialize
+    logging with different settings.
     
     Side Effects:
+        - Drains queued records and stops the QueueListener thread
         - Closes all file handles and handlers attached to the logger
         - Removes all handlers from the logger
         - Sets global _logger to None
         - Sets global _log_file_path to None
+        - Rebinds the convenience functions to lazy stand-ins
     
     Example:
         >>> setup_logging(module_name='test', log_level='INFO')
@@ -622,7 +781,9 @@ def reset_logging() -> None:
         mainly useful for testing scenarios where you need to reset
         logging state between tests.
     """
-    global _logger, _log_file_path
+    global _logger, _log_file_path, _log_file_suffix
+    
+    _stop_listener()
     
     if _logger is not None:
         for handler in _logger.handlers[:]:
@@ -630,6 +791,8 @@ def reset_logging() -> None:
             _logger.removeHandler(handler)
         _logger = None
         _log_file_path = None
+        _log_file_suffix = ''
+        _bind_logger_methods(None)
 
 
 # Backward compatibility alias
@@ -851,8 +1014,7 @@ def cleanup_old_logs(
     
     # Determine log directory
     if log_dir is None:
-        logs_root = os.getenv('LOG_DIR', '.logs')
-        log_dir = Path(logs_root) / 'RePORTaLiN'
+        log_dir = _base_log_dir(os.getenv('LOG_DIR', '.logs'))
     else:
         log_dir = Path(log_dir)
     
@@ -981,6 +1143,57 @@ def cleanup_old_logs(
 # Convenience Logging Functions
 # ============================================================================
 
+def _lazy_logger_method(name: str) -> Callable[..., Any]:
+    """Build a stand-in for a bound logger method used before setup.
+    
+    The returned callable initializes logging through get_logger() on first
+    use and then forwards to the named method of the real logger.
+    
+    Args:
+        name: Name of the logging.Logger method to forward to.
+    
+    Returns:
+        A callable with the same signature as the logger method.
+    """
+    def call(*args: Any, **kwargs: Any) -> Any:
+        return getattr(get_logger(), name)(*args, **kwargs)
+    return call
+
+
+def _bind_logger_methods(logger: Optional[logging.Logger]) -> None:
+    """Bind the convenience functions to the given logger's methods.
+    
+    The convenience functions (debug, info, ...) call these module-level
+    bound methods directly instead of going through get_logger() on every
+    log call. setup_logging() binds them to the new logger; reset_logging()
+    passes None to restore the lazy stand-ins.
+    
+    Args:
+        logger: The active logger, or None if logging is not set up.
+    """
+    global _debug, _info, _warning, _error, _critical, _success, _is_enabled_for
+    
+    if logger is None:
+        _debug = _lazy_logger_method('debug')
+        _info = _lazy_logger_method('info')
+        _warning = _lazy_logger_method('warning')
+        _error = _lazy_logger_method('error')
+        _critical = _lazy_logger_method('critical')
+        _success = functools.partial(_lazy_logger_method('log'), SUCCESS)
+        _is_enabled_for = _lazy_logger_method('isEnabledFor')
+    else:
+        _debug = logger.debug
+        _info = logger.info
+        _warning = logger.warning
+        _error = logger.error
+        _critical = logger.critical
+        _success = functools.partial(logger.log, SUCCESS)
+        _is_enabled_for = logger.isEnabledFor
+
+
+_bind_logger_methods(None)
+
+
 def _append_log_path(msg: str, include_log_path: bool) -> str:
     """Helper to append log file path to messages.
     
@@ -1002,8 +1215,8 @@ def _append_log_path(msg: str, include_log_path: bool) -> str:
         >>> _append_log_path("Error occurred", False)
         'Error occurred'
     """
-    if include_log_path and get_log_file_path():
-        return f"{msg}\nFor more details, check the log file at: {get_log_file_path()}"
+    if include_log_path:
+        return msg + _log_file_suffix
     return msg
 
 
@@ -1023,7 +1236,7 @@ def debug(msg: str, *args: Any, **kwargs: Any) -> None:
         >>> debug("Processing record %d of %d", 5, 100)
         >>> debug("Variable state: x=%s, y=%s", x, y)
     """
-    get_logger().debug(msg, *args, **kwargs)
+    _debug(msg, *args, **kwargs)
 
 
 def info(msg: str, *args: Any, **kwargs: Any) -> None:
@@ -1042,7 +1255,7 @@ def info(msg: str, *args: Any, **kwargs: Any) -> None:
         >>> info("Starting data extraction from %s", filename)
         >>> info("Processed %d records successfully", count)
     """
-    get_logger().info(msg, *args, **kwargs)
+    _info(msg, *args, **kwargs)
 
 
 def warning(msg: str, *args: Any, include_log_path: bool = False, **kwargs: Any) -> None:
@@ -1062,7 +1275,8 @@ def warning(msg: str, *args: Any, include_log_path: bool = False, **kwargs: Any)
         >>> warning("Missing optional field: %s", field_name)
         >>> warning("Retrying operation due to timeout", include_log_path=True)
     """
-    get_logger().warning(_append_log_path(msg, include_log_path), *args, **kwargs)
+    if _is_enabled_for(logging.WARNING):
+        _warning(_append_log_path(msg, include_log_path), *args, **kwargs)
 
 
 def error(msg: str, *args: Any, include_log_path: bool = True, **kwargs: Any) -> None:
@@ -1083,7 +1297,8 @@ def error(msg: str, *args: Any, include_log_path: bool = True, **kwargs: Any) ->
         >>> error("Failed to open file: %s", filename)
         >>> error("Database connection failed", include_log_path=True)
     """
-    get_logger().error(_append_log_path(msg, include_log_path), *args, **kwargs)
+    if _is_enabled_for(logging.ERROR):
+        _error(_append_log_path(msg, include_log_path), *args, **kwargs)
 
 
 def critical(msg: str, *args: Any, include_log_path: bool = True, **kwargs: Any) -> None:
@@ -1104,7 +1319,8 @@ def critical(msg: str, *args: Any, include_log_path: bool = True, **kwargs: Any)
         >>> critical("System out of memory, terminating")
         >>> critical("Configuration file corrupted", include_log_path=True)
     """
-    get_logger().critical(_append_log_path(msg, include_log_path), *args, **kwargs)
+    if _is_enabled_for(logging.CRITICAL):
+        _critical(_append_log_path(msg, include_log_path), *args, **kwargs)
 
 
 def success(msg: str, *args: Any, **kwargs: Any) -> None:
@@ -1128,7 +1344,7 @@ def success(msg: str, *args: Any, **kwargs: Any) -> None:
         SUCCESS messages are always visible on console in default mode,
         making them ideal for user-facing status updates.
     """
-    get_logger().log(SUCCESS, msg, *args, **kwargs)
+    _success(msg, *args, **kwargs)
 
 
 def exception(msg: str, *args: Any, include_log_path: bool = True, **kwargs: Any) -> None:
@@ -1156,8 +1372,11 @@ def exception(msg: str, *args: Any, include_log_path: bool = True, **kwargs: Any
         This function automatically sets exc_info=True to capture the full
         exception traceback, unless explicitly overridden in kwargs.
     """
-    kwargs.setdefault('exc_info', True)
-    get_logger().error(_append_log_path(msg, include_log_path), *args, **kwargs)
+    if _is_enabled_for(logging.ERROR):
+        kwargs.setdefault('exc_info', True)
+        if include_log_path:
+            msg += _log_file_suffix
+        _error(msg, *args, **kwargs)
 
 
 # Add success method to Logger class
@@ -1193,6 +1412,31 @@ logging.Logger.success = _success_method  # type: ignore[attr-defined]
 # Decorators and Context Managers
 # ============================================================================
 
+def _safe_repr(value: Any, limit: int = 200) -> str:
+    """Return repr(value), truncated to at most limit characters.
+    
+    Used by log_errors() so that large arguments (DataFrames, big dicts)
+    cannot flood the log file or dominate exception handling time.
+    
+    Args:
+        value: The object to represent.
+        limit: Maximum number of characters to keep (default: 200).
+    
+    Returns:
+        The repr of value, with a '...<N more>' marker if it was truncated.
+    
+    Example:
+        >>> _safe_repr('abc')
+        "'abc'"
+        >>> _safe_repr('x' * 300, limit=5)
+        "'xxxx...<297 more>"
+    """
+    text = repr(value)
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}...<{len(text) - limit} more>"
+
+
 def log_errors(logger_name: Optional[str] = None, reraise: bool = True):
     """Decorator to automatically log exceptions with full stack trace.
     
@@ -1241,19 +1485,28 @@ def log_errors(logger_name: Optional[str] = None, reraise: bool = True):
     
     Note:
         The decorator logs both the exception message and the function's
-        arguments/kwargs, which can be very helpful for debugging. Be aware
-        this may log sensitive data if present in function arguments.
+        arguments/kwargs, which can be very helpful for debugging. Each
+        argument's repr is truncated to 200 characters. Be aware this may
+        log sensitive data if present in function arguments.
     """
     def decorator(func: Callable) -> Callable:
+        # Resolve the child logger once; setup is still deferred to first call
+        logger = logging.getLogger(f'reportalin.{logger_name or func.__module__}')
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            logger = get_logger(logger_name or func.__module__)
+            if _logger is None:
+                setup_logging()
             try:
                 return func(*args, **kwargs)
             except Exception as e:
+                args_repr = ", ".join(_safe_repr(a) for a in args)
+                kwargs_repr = ", ".join(
+                    f"{k!r}: {_safe_repr(v)}" for k, v in kwargs.items()
+                )
                 logger.exception(
                     f"Exception in {func.__name__}: {e}\n"
-                    f"Args: {args}, Kwargs: {kwargs}"
+                    f"Args: ({args_repr}), Kwargs: {{{kwargs_repr}}}"
                 )
                 if reraise:
                     raise
@@ -1309,22 +1562,25 @@ def log_time(logger_name: Optional[str] = None, level: int = logging.INFO):
         helps diagnose performance issues that lead to failures.
     """
     def decorator(func: Callable) -> Callable:
+        # Resolve the child logger once; setup is still deferred to first call
+        logger = logging.getLogger(f'reportalin.{logger_name or func.__module__}')
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            logger = get_logger(logger_name or func.__module__)
+            if _logger is None:
+                setup_logging()
             start_time = time.time()
             try:
                 result = func(*args, **kwargs)
                 elapsed = time.time() - start_time
                 logger.log(
-                    level,
-                    f"{func.__name__} completed in {elapsed:.2f}s"
+                    level, "%s completed in %.2fs", func.__name__, elapsed
                 )
                 return result
             except Exception as e:
                 elapsed = time.time() - start_time
                 logger.error(
-                    f"{func.__name__} failed after {elapsed:.2f}s: {e}",
+                    "%s failed after %.2fs: %s", func.__name__, elapsed, e,
                     exc_info=True
                 )
                 raise
@@ -1388,11 +1644,11 @@ def log_execution_time(operation_name: str, logger_name: Optional[str] = None):
     try:
         yield
         elapsed = time.time() - start_time
-        logger.info(f"{operation_name} completed in {elapsed:.2f}s")
+        logger.info("%s completed in %.2fs", operation_name, elapsed)
     except Exception as e:
         elapsed = time.time() - start_time
         logger.error(
-            f"{operation_name} failed after {elapsed:.2f}s: {e}",
+            "%s failed after %.2fs: %s", operation_name, elapsed, e,
             exc_info=True
         )
         raise
@@ -1451,10 +1707,12 @@ class VerboseLogger:
     
     Note:
         VerboseLogger is designed to have zero performance impact when not
-        in DEBUG mode. All methods check _is_verbose() first and return
+        in DEBUG mode. All methods check _verbose_enabled() first and return
         immediately if verbose logging is disabled.
     """
     
+    __slots__ = ('log', '_indent')
+    
     def __init__(self, logger_module: types.ModuleType) -> None:
         """Initialize with logger module.
         
@@ -1495,18 +1753,11 @@ class VerboseLogger:
             False otherwise (including when logging isn't set up yet).
         
         Note:
-            This method is safe to call during module import or before
-            logging initialization. It returns False if anything goes wrong.
+            Delegates to _verbose_enabled(), so it follows level changes
+            made after setup and is safe to call during module import or
+            before logging initialization.
         """
-        try:
-            # Safe check: Handle case where logging isn't set up yet
-            if _logger is None:
-                return False
-            logger = get_logger()
-            return logger and logger.level == logging.DEBUG
-        except Exception:
-            # During module import, logging might not be ready
-            return False
+        return _verbose_enabled()
     
     def _log_tree(self, prefix: str, message: str) -> None:
         """Log with tree-view formatting.
@@ -1519,16 +1770,14 @@ class VerboseLogger:
             message: The message to log.
         
         Note:
-            Silently ignores errors to prevent logging failures from
-            breaking application flow during module initialization.
+            Returns immediately unless _verbose_enabled(), which is also
+            False during module import before logging is set up.
         """
-        if self._is_verbose():
-            try:
-                indent = "  " * self._indent
-                self.log.debug(f"{indent}{prefix}{message}")
-            except Exception:
-                # Silently ignore if logging fails during import
-                pass
+        if not _verbose_enabled():
+            return
+        depth = self._indent
+        indent = _INDENTS[depth] if depth < len(_INDENTS) else "  " * depth
+        self.log.debug(f"{indent}{prefix}{message}")
     
     class _ContextManager:
         """Context manager for tree-view logging blocks.
@@ -1542,6 +1791,8 @@ class VerboseLogger:
             header: Header message to log when entering context.
             footer: Optional footer message to log when exiting context.
         """
+        __slots__ = ('vlog', 'prefix', 'header', 'footer')
+        
         def __init__(self, vlog: 'VerboseLogger', prefix: str, header: str, footer: str = None):
             """Initialize context manager.
             
@@ -1656,10 +1907,7 @@ class VerboseLogger:
             # │  Reading headers
             # │  Loading rows
         """
-        try:
-            self._log_tree("│  ", message)
-        except Exception:
-            pass
+        self._log_tree("│  ", message)
     
     def metric(self, label: str, value: Any) -> None:
         """Log a metric/statistic.
@@ -1680,10 +1928,7 @@ class VerboseLogger:
             # ├─ Processing rate: 125 rec/sec
             # ├─ Memory usage: 245 MB
         """
-        try:
-            self._log_tree("├─ ", f"{label}: {value}")
-        except Exception:
-            pass
+        self._log_tree("├─ ", f"{label}: {value}")
     
     def timing(self, operation: str, seconds: float) -> None:
         """Log operation timing.
@@ -1704,10 +1949,7 @@ class VerboseLogger:
             # Output:
             # ├─ ⏱ Data validation: 2.34s
         """
-        try:
-            self._log_tree("├─ ", f"⏱ {operation}: {seconds:.2f}s")
-        except Exception:
-            pass
+        self._log_tree("├─ ", f"⏱ {operation}: {seconds:.2f}s")
     
     def items_list(self, label: str, items: list, max_show: int = 5) -> None:
         """Log a list of items with truncation if too long.
@@ -1736,16 +1978,13 @@ class VerboseLogger:
                 # Output:
                 # │  Files: 0, 1, 2 ... (+17 more)
         """
-        if not self._is_verbose():
+        if not _verbose_enabled():
             return
         
-        try:
-            if len(items) <= max_show:
-                self.detail(f"{label}: {', '.join(str(i) for i in items)}")
-            else:
-                self.detail(f"{label}: {', '.join(str(i) for i in items[:max_show])} ... (+{len(items)-max_show} more)")
-        except Exception:
-            pass
+        if len(items) <= max_show:
+            self.detail(f"{label}: {', '.join(str(i) for i in items)}")
+        else:
+            self.detail(f"{label}: {', '.join(str(i) for i in items[:max_show])} ... (+{len(items)-max_show} more)")
 
 
 # Create a global VerboseLogger instance
@@ -111,7 +111,7 @@ Programmatic usage:
 **Dependencies:**
 - config module for default DATA_DIR
 - scripts.utils.logging_system for comprehensive logging
-- Standard library: argparse, os, shutil, sys, pathlib, datetime
+- Standard library: argparse, concurrent.futures, os, shutil, sys, pathlib, datetime
 
 **Warning:**
 Default path mode MOVES files (deletes originals). Ensure external backups
@@ -127,11 +127,17 @@ See Also:
 """
 
 import argparse
+import errno
 import os
+import re
 import shutil
+import stat
 import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import Dict, List, Tuple
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
 from datetime import datetime
 
 # Fix sys.path to avoid local logging.py shadowing standard logging
@@ -143,6 +149,8 @@ if _script_dir in sys.path:
     sys.path.remove(_script_dir)
 
 # Now import standard logging
+import logging
+
 # Add root directory for imports
 if _root_dir not in sys.path:
     sys.path.insert(0, _root_dir)
@@ -156,15 +164,277 @@ log.setup_logging(
     log_level="INFO"
 )
 
+# Dataset folder suffixes stripped to derive the study name (one alternation,
+# leftmost match, so '_csv_files' wins over '_files')
+_STUDY_SUFFIX_RE = re.compile(r'(?:_csv_files|_files|_data|_dataset|_excel)$', re.IGNORECASE)
+
+# Study names too generic to identify a study; these trigger the fallback
+_GENERIC_STUDY_NAMES = frozenset({'dataset', 'data', 'files', 'csv', 'excel', 'raw'})
+
+# Files per submission batch in move_files; also the progress-report interval
+_TRANSFER_BATCH_SIZE = 256
+
+# Copies of files at least this large run on a separate, narrow pool so a few
+# big sequential streams do not compete with each other (or starve the many
+# small files) for disk bandwidth
+_LARGE_FILE_MIN_SIZE = 8 * 1024 * 1024
+_LARGE_FILE_WORKERS = 4
+
+# Number of migration log entries kept in memory; the full log is streamed
+# to migration_log.txt as the migration runs
+_RECENT_LOG_ENTRIES = 100
+
+# Buffer for the streamed migration log (one write() per MiB of entries)
+_MIGRATION_LOG_BUFFER = 1024 * 1024
+
+# Upper bound on in-flight transfers, so streamed walks use bounded memory
+_MAX_PENDING_TRANSFERS = 2 * _TRANSFER_BATCH_SIZE
+
+# Subdirectories of a study folder in the standardized structure
+_NEW_STRUCTURE_DIRS = frozenset({'datasets', 'annotated_pdfs', 'data_dictionary'})
+
+# Files at least this large are copied with kernel read-ahead/cache hints
+_FADVISE_MIN_SIZE = 8 * 1024 * 1024
+_HAS_FADVISE = hasattr(os, 'posix_fadvise') and hasattr(os, 'sendfile')
+
+# Directory-fd based walking for file counts
+_HAS_FWALK = hasattr(os, 'fwalk')
+
+# Copies at least this large are written back immediately and not cached
+_WRITE_THROUGH_MIN_SIZE = 64 * 1024 * 1024
+
+# Files at least this large are copied in-kernel with copy_file_range()
+_COPY_FILE_RANGE_MIN_SIZE = 1024 * 1024
+_HAS_COPY_FILE_RANGE = _HAS_FADVISE and hasattr(os, 'copy_file_range')
+
+# Linux ioctl that makes the destination share the source's extents
+# (copy-on-write clone on Btrfs, XFS, bcachefs, ...)
+_FICLONE = 0x40049409
+_HAS_FICLONE = _HAS_COPY_FILE_RANGE and sys.platform.startswith('linux')
+if _HAS_FICLONE:
+    import fcntl
+
+# errno values meaning "this in-kernel copy is not available here"
+_KERNEL_COPY_UNSUPPORTED = frozenset(
+    code for code in (
+        getattr(errno, name, None)
+        for name in ('EXDEV', 'EINVAL', 'ENOSYS', 'ENOTSUP', 'EOPNOTSUPP', 'EBADF', 'ENOTTY')
+    ) if code is not None
+)
+
+# Windows copies through a userspace buffer; a larger one cuts the number of
+# read/write calls for multi-megabyte CRF spreadsheets and PDFs
+if sys.platform == 'win32' and config.MIGRATION_LARGE_COPY_BUFFER:
+    shutil.COPY_BUFSIZE = max(shutil.COPY_BUFSIZE, 16 * 1024 * 1024)
+
+
+def _fast_copy(src: str, dst: str, src_stat: Optional[os.stat_result] = None) -> None:
+    """Copy a file and its metadata, like shutil.copy2.
+    
+    On Linux, files of at least _COPY_FILE_RANGE_MIN_SIZE are first cloned
+    with the FICLONE ioctl, which on copy-on-write filesystems (Btrfs, XFS
+    with reflink) completes in metadata time without moving any data. If
+    the filesystem cannot clone, os.copy_file_range is used, which stays
+    inside the kernel and lets filesystems such as NFS 4.2 copy
+    server-side. Where the filesystem pair does not support it (e.g. EXDEV
+    on older kernels), os.sendfile is used instead. Files of at least _FADVISE_MIN_SIZE are
+    additionally read with a sequential-access hint (larger read-ahead) and
+    dropped from the page cache afterwards, so a bulk import does not evict
+    everything else. Copies of at least _WRITE_THROUGH_MIN_SIZE are also
+    flushed and dropped from the cache on the destination side. Smaller
+    files and other platforms go through shutil.copy2.
+    
+    Args:
+        src: Source file path.
+        dst: Destination file path (overwritten if it exists).
+        src_stat: stat result for src, if the caller already has one (e.g.
+            from a cached os.scandir entry), saving another stat() call.
+    """
+    if not (_HAS_COPY_FILE_RANGE or _HAS_FADVISE):
+        shutil.copy2(src, dst)
+        return
+    
+    size = (src_stat or os.stat(src)).st_size
+    if size < (_COPY_FILE_RANGE_MIN_SIZE if _HAS_COPY_FILE_RANGE else _FADVISE_MIN_SIZE):
+        shutil.copy2(src, dst)
+        return
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd = fsrc.fileno()
+        out_fd = fdst.fileno()
+        use_fadvise = _HAS_FADVISE and size >= _FADVISE_MIN_SIZE
+        if use_fadvise:
+            os.posix_fadvise(in_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        offset = 0
+        if _HAS_FICLONE:
+            try:
+                fcntl.ioctl(out_fd, _FICLONE, in_fd)
+                offset = size
+            except OSError as e:
+                if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                    raise
+        
+        if _HAS_COPY_FILE_RANGE and offset == 0:
+            try:
+                while offset < size:
+                    copied = os.copy_file_range(in_fd, out_fd, size - offset, offset, offset)
+                    if copied == 0:
+                        break
+                    offset += copied
+            except OSError as e:
+                if offset or e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                    raise
+        
+        if offset == 0:
+            try:
+                while offset < size:
+                    sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError as e:
+                if offset or e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                    raise
+                # No in-kernel copy for this filesystem: buffered copy
+                shutil.copyfileobj(fsrc, fdst)
+        
+        if use_fadvise:
+            os.posix_fadvise(in_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        
+        # Very large files: write the copy back now and drop it from the
+        # cache too, so writeback stays steady instead of piling up dirty
+        # pages for one burst at the final sync
+        if use_fadvise and size >= _WRITE_THROUGH_MIN_SIZE:
+            os.fdatasync(out_fd)
+            os.posix_fadvise(out_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    
+    shutil.copystat(src, dst)
+
+
+def _migration_workers() -> int:
+    """Return the thread pool size used for file copies and moves.
+    
+    Defaults to four threads per CPU (capped at 32), which suits SSDs and
+    network shares. Set MIGRATION_WORKERS to a lower value (e.g. 4-8) for
+    spinning disks, where parallel seeks hurt throughput.
+    
+    Returns:
+        Number of worker threads (at least 1).
+    """
+    env_workers = os.getenv('MIGRATION_WORKERS')
+    if env_workers:
+        try:
+            return max(1, int(env_workers))
+        except ValueError:
+            log.warning(f"Ignoring invalid MIGRATION_WORKERS value: {env_workers!r}")
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+def _iter_files(root: Path) -> Iterator[Tuple[os.DirEntry, str]]:
+    """Recursively yield the files below root using os.scandir.
+    
+    Unlike Path.rglob() + is_file(), DirEntry.is_file() and is_dir() use the
+    file type cached from the directory listing, so no extra stat() is
+    needed per entry on most platforms. Symlinked directories are not
+    descended into, matching rglob(). Relative paths are built from each
+    directory's prefix as the walk descends, so callers never need
+    Path.relative_to().
+    
+    Args:
+        root: Directory to walk.
+    
+    Yields:
+        (entry, relative_path) for every regular file (or symlink to one)
+        under root, where relative_path is relative to root.
+    """
+    stack = [(os.fspath(root), '')]
+    while stack:
+        dir_path, rel_prefix = stack.pop()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, f"{rel_prefix}{entry.name}{os.sep}"))
+                elif entry.is_file():
+                    yield entry, rel_prefix + entry.name
+
 
-def extract_study_name(data_dir: Path) -> str:
+def _count_files(root: Path) -> int:
+    """Count the files below root.
+    
+    Where os.fwalk is available (POSIX), the walk holds a file descriptor
+    per directory and opens each child relative to it, so the kernel does
+    not re-resolve the full path from root at every level of a deep tree.
+    Only names are needed for a count, so no per-entry objects are kept.
+    Other platforms count with _iter_files().
+    
+    Args:
+        root: Directory to walk.
+    
+    Returns:
+        Number of non-directory entries at any depth. Unlike _iter_files(),
+        the fwalk count includes special files and dangling symlinks; study
+        folders only hold regular files, and counts are used for logging.
+    """
+    if _HAS_FWALK:
+        return sum(len(filenames) for _, _, filenames, _ in os.fwalk(root))
+    return sum(1 for _ in _iter_files(root))
+
+
+def _has_files(root: Path) -> bool:
+    """Return True as soon as a single file is found below root.
+    
+    Args:
+        root: Directory to probe.
+    
+    Returns:
+        True if root contains at least one file (at any depth).
+    """
+    return any(True for _ in _iter_files(root))
+
+
+def _scan_dir(path: Path) -> Optional[Dict[str, bool]]:
+    """List a directory once with os.scandir.
+    
+    Args:
+        path: Directory to list.
+    
+    Returns:
+        Dictionary mapping entry names to whether they are directories, in
+        directory order, or None if path does not exist or is not a directory.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _first_subdir(entries: Optional[Dict[str, bool]]) -> Optional[str]:
+    """Return the first subdirectory name in a _scan_dir() listing.
+    
+    Args:
+        entries: Listing as returned by _scan_dir(), or None.
+    
+    Returns:
+        Name of the first directory entry in directory order, or None if
+        there is no listing or it contains no directories.
+    """
+    if not entries:
+        return None
+    return next((name for name, is_dir in entries.items() if is_dir), None)
+
+
+def extract_study_name(data_dir: Path,
+                       dataset_entries: Optional[Dict[str, bool]] = None) -> str:
     """Extract study name from dataset folder with intelligent fallback logic.
     
     Implements multi-stage study name detection algorithm:
     
     1. **Locate Dataset**: Scans data_dir/dataset/ for subdirectories
     2. **Extract Name**: Uses first subdirectory name as base
-    3. **Clean Suffixes**: Removes common suffixes (_csv_files, _files, _data, etc.)
+    3. **Clean Suffixes**: Removes common suffixes (_csv_files, _files, _data, etc.,
+       case-insensitive)
     4. **Capitalize**: Capitalizes parts after hyphens (indo-vap → Indo-VAP)
     5. **Validate**: Checks length (>=2 chars) and rejects generic names
     6. **Fallback**: Returns 'ext_data' if detection fails or name is generic
@@ -175,6 +445,8 @@ def extract_study_name(data_dir: Path) -> str:
     Args:
         data_dir: Path to data directory containing dataset/ subdirectory.
             Expected structure: data_dir/dataset/StudyName_csv_files/
+        dataset_entries: Optional listing of data_dir/dataset/ as returned by
+            _scan_dir(), so callers that already scanned it avoid a rescan.
     
     Returns:
         Detected study name (cleaned and capitalized) or 'ext_data' fallback.
@@ -209,49 +481,197 @@ def extract_study_name(data_dir: Path) -> str:
         Generic names that trigger fallback: 'dataset', 'data', 'files',
         'csv', 'excel', 'raw'. This prevents meaningless study identifiers.
     """
-    dataset_dir = data_dir / 'dataset'
-    
-    # Generic names that trigger fallback
-    generic_names = {'dataset', 'data', 'files', 'csv', 'excel', 'raw'}
+    if dataset_entries is None:
+        dataset_entries = _scan_dir(data_dir / 'dataset')
     
-    if not dataset_dir.exists():
+    if dataset_entries is None:
         log.warning("Dataset directory not found, using fallback name 'ext_data'")
         return 'ext_data'
     
     # Find first subdirectory in dataset folder
-    subdirs = [d for d in dataset_dir.iterdir() if d.is_dir()]
+    folder_name = _first_subdir(dataset_entries)
     
-    if not subdirs:
+    if folder_name is None:
         log.warning("No subdirectories in dataset folder, using fallback name 'ext_data'")
         return 'ext_data'
     
-    # Get the first subdirectory name
-    folder_name = subdirs[0].name
     log.info(f"Detected dataset folder: {folder_name}")
     
     # Remove common suffixes
-    study_name = folder_name
-    suffixes_to_remove = ['_csv_files', '_files', '_data', '_dataset', '_excel']
-    for suffix in suffixes_to_remove:
-        if study_name.endswith(suffix):
-            study_name = study_name[:-len(suffix)]
-            break
+    study_name = _STUDY_SUFFIX_RE.sub('', folder_name, count=1)
     
     # Check if name is too short or generic
-    if len(study_name) < 2 or study_name.lower() in generic_names:
+    if len(study_name) < 2 or study_name.lower() in _GENERIC_STUDY_NAMES:
         log.warning(f"Study name '{study_name}' is generic, using fallback 'ext_data'")
         return 'ext_data'
     
-    # Capitalize parts after hyphen (Indo-vap -> Indo-VAP)
-    if '-' in study_name:
-        parts = study_name.split('-')
-        # Keep first part as-is, capitalize rest
-        study_name = parts[0] + '-' + '-'.join(p.upper() for p in parts[1:])
+    # Capitalize parts after hyphen (Indo-vap -> Indo-VAP).
+    # Keep first part as-is, capitalize rest; upper-casing the remainder in
+    # one call is the same as upper-casing each hyphen-separated part
+    head, sep, tail = study_name.partition('-')
+    if sep:
+        study_name = f"{head}-{tail.upper()}"
     
     log.info(f"Extracted study name: {study_name}")
     return study_name
 
 
+class _TransferTracker:
+    """Bookkeeping for the file transfers of one migration mapping.
+    
+    Keeps at most _MAX_PENDING_TRANSFERS futures in flight: once that many
+    are outstanding, submit() waits for some to finish and records them, so
+    a streaming directory walk never accumulates one future per file.
+    Copies can instead be queue()d: they are submitted a batch at a time in
+    inode order, which roughly follows on-disk layout and turns scattered
+    reads into mostly forward seeks on spinning disks.
+    Completed transfers are tallied into counters, error messages and
+    migration log entries on the submitting thread.
+    
+    Attributes:
+        processed: Number of files transferred successfully
+        failed: Number of files that failed
+        errors: Error message for each failed file
+        action_past: "copied" or "moved", for summary messages
+    """
+    
+    def __init__(self, record_entry: Callable[[str], None], old_path: str, new_path: str,
+                 operation: str, total: Optional[int] = None):
+        """Start tracking one mapping.
+        
+        Args:
+            record_entry: Manager callback that records a migration log entry.
+            old_path: Mapping key, used for migration log entries.
+            new_path: Mapping value, used for migration log entries.
+            operation: "Copying" or "Moving", used in messages.
+            total: Number of files in the mapping, shown in progress lines
+                (e.g. "Progress: 512/1200 files moved..."), if known;
+                otherwise only the running count is shown.
+        """
+        self.record_entry = record_entry
+        self.old_path = old_path
+        self.new_path = new_path
+        self.operation = operation.lower()
+        self.action_past = "copied" if operation == "Copying" else "moved"
+        self.pending: Dict[Future, Tuple[str, str]] = {}
+        self.queued: List[Tuple[int, ThreadPoolExecutor, str, str, Callable[..., str], tuple]] = []
+        self.processed = 0
+        self.failed = 0
+        self.errors: List[str] = []
+        self.total = total
+        self._next_report = _TRANSFER_BATCH_SIZE
+    
+    def submit(self, executor: ThreadPoolExecutor, file_path: str, rel_path: str,
+               fn: Callable[..., str], *args) -> None:
+        """Submit fn(*args) for one file, draining results if too many are pending.
+        
+        Args:
+            executor: Thread pool to run the transfer on.
+            file_path: Source path, used in error messages.
+            rel_path: Path relative to the mapping, used in the migration log.
+            fn: Transfer function returning the past-tense action.
+            *args: Arguments for fn.
+        """
+        future = executor.submit(fn, *args)
+        self.pending[future] = (file_path, rel_path)
+        if len(self.pending) >= _MAX_PENDING_TRANSFERS:
+            done, _ = wait(self.pending, return_when=FIRST_COMPLETED)
+            self._record(done)
+    
+    def queue(self, executor: ThreadPoolExecutor, inode: int, file_path: str,
+              rel_path: str, fn: Callable[..., str], *args) -> None:
+        """Queue fn(*args) for one file; submit in inode order once a batch is full.
+        
+        Args:
+            executor: Thread pool to run the transfer on.
+            inode: Source inode number (st_ino), used as the sort key.
+            file_path: Source path, used in error messages.
+            rel_path: Path relative to the mapping, used in the migration log.
+            fn: Transfer function returning the past-tense action.
+            *args: Arguments for fn.
+        """
+        self.queued.append((inode, executor, file_path, rel_path, fn, args))
+        if len(self.queued) >= _TRANSFER_BATCH_SIZE:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Submit all queued transfers, lowest inode first."""
+        queued = self.queued
+        self.queued = []
+        queued.sort(key=lambda item: item[0])
+        for _inode, executor, file_path, rel_path, fn, args in queued:
+            self.submit(executor, file_path, rel_path, fn, *args)
+    
+    def run(self, file_path: str, rel_path: str, fn: Callable[..., str], *args) -> None:
+        """Run fn(*args) for one file on the calling thread and record the result.
+        
+        Used for transfers that are a single metadata syscall (same-device
+        renames), where handing work to the pool costs more than doing it.
+        
+        Args:
+            file_path: Source path, used in error messages.
+            rel_path: Path relative to the mapping, used in the migration log.
+            fn: Transfer function returning the past-tense action.
+            *args: Arguments for fn.
+        """
+        try:
+            action = fn(*args)
+        except Exception as e:
+            self.fail(file_path, e)
+            return
+        self._record_success(rel_path, action)
+    
+    def fail(self, file_path: str, error: Any) -> None:
+        """Record a file that could not be transferred.
+        
+        Args:
+            file_path: Source path of the failed file.
+            error: Exception or message describing the failure.
+        """
+        self.failed += 1
+        error_msg = f"Failed to {self.operation} {file_path}: {error}"
+        log.error(error_msg)
+        self.errors.append(error_msg)
+    
+    def finish(self) -> Tuple[int, int, List[str]]:
+        """Submit any queued transfers and wait for all pending ones.
+        
+        Returns:
+            Tuple of (files_processed, files_failed, error_messages).
+        """
+        self.flush()
+        self._record(as_completed(list(self.pending)))
+        return self.processed, self.failed, self.errors
+    
+    def _record(self, futures: Iterable[Future]) -> None:
+        """Tally completed futures and drop them from the pending set."""
+        for future in futures:
+            file_path, rel_path = self.pending.pop(future)
+            try:
+                action = future.result()
+            except Exception as e:
+                self.fail(file_path, e)
+                continue
+            self._record_success(rel_path, action)
+    
+    def _record_success(self, rel_path: str, action: str) -> None:
+        """Count one transferred file and add its migration log entry."""
+        self.processed += 1
+        
+        # One progress line per completed batch rather than a modulo
+        # check (and log call) every 10 files
+        if self.processed == self._next_report:
+            if self.total is not None:
+                log.info("Progress: %d/%d files %s...", self.processed, self.total, action.lower())
+            else:
+                log.info("Progress: %d files %s...", self.processed, action.lower())
+            self._next_report += _TRANSFER_BATCH_SIZE
+        
+        self.record_entry(
+            f"{action}: {self.old_path}/{rel_path} → {self.new_path}/{rel_path}"
+        )
+
+
 class DataMigrationManager:
     """Manages migration of data structure from legacy to standardized format.
     
@@ -291,7 +711,13 @@ class DataMigrationManager:
         source_dir: Path to source data directory (custom or default)
         dest_dir: Path to destination data directory (always project data/)
         dry_run: If True, simulate operations without file changes
-        migration_log: List of operation descriptions for audit log
+        link_files: If True, hardlink instead of copy in custom path mode
+        auto_confirm: If True, answer confirmation questions without prompting
+        verbose: If True, log exact file counts during validation and totals
+            in transfer progress lines
+        confirmed: Answers from collect_confirmations() (None until collected)
+        migration_log: Most recent operation descriptions (the full audit log
+            is streamed to migration_log.txt)
         migration_success: Boolean flag indicating if migration completed
         is_custom_path: True if using custom (external) source path
         study_name: Auto-detected study identifier (e.g., "Indo-VAP")
@@ -325,7 +751,10 @@ class DataMigrationManager:
         Always test with --dry-run first!
     """
     
-    def __init__(self, data_dir: Path = None, dry_run: bool = False):
+    def __init__(self, data_dir: Path = None, dry_run: bool = False,
+                 link_files: bool = False, auto_confirm: bool = False,
+                 verbose: bool = False, skip_cleanup: bool = False,
+                 workers: Optional[int] = None):
         """Initialize migration manager with path detection and configuration.
         
         Automatically determines operation mode (custom vs default path),
@@ -339,6 +768,21 @@ class DataMigrationManager:
                 (deleted after copy).
             dry_run: If True, simulate all operations without actual file
                 changes. Useful for testing migration before execution.
+            link_files: If True (custom path mode only), hardlink files into
+                project data/ instead of copying them when source and
+                destination are on the same filesystem. Hardlinks share
+                content with the originals, so edits to either are visible
+                in both. Falls back to copying when linking fails.
+            auto_confirm: If True, collect_confirmations() answers its
+                questions without prompting (see collect_confirmations()).
+            verbose: If True, validation walks each tree to log exact file
+                counts, and each source is counted up front so progress
+                lines show a total; otherwise neither walk is done.
+            skip_cleanup: If True, no cleanup questions are asked and the old
+                structure and copied study folder are both kept.
+            workers: Size of the file transfer thread pool. Defaults to the
+                MIGRATION_WORKERS environment variable, else four per CPU
+                (capped at 32).
         
         Side Effects:
             - Logs initialization details (paths, mode, study name)
@@ -364,12 +808,35 @@ class DataMigrationManager:
         """
         self.source_dir = Path(data_dir) if data_dir else Path(config.DATA_DIR)
         self.dry_run = dry_run
-        self.migration_log = []
+        self.link_files = link_files
+        self.auto_confirm = auto_confirm
+        self.verbose = verbose
+        self.skip_cleanup = skip_cleanup
+        self.workers = workers
+        self.confirmed: Optional[Dict[str, bool]] = None
+        self._already_migrated: Optional[bool] = None
+        self._source_exists: Optional[bool] = None
+        self._existing_old_paths: Optional[Set[str]] = None
+        self.migration_log: Deque[str] = deque(maxlen=_RECENT_LOG_ENTRIES)
+        self._log_fh: Optional[TextIO] = None
+        self._log_failed = False
         self.migration_success = False
+        self.files_per_new_path: Dict[str, int] = {}
         
-        # Detect if using custom data path
+        # Detect if using custom data path. Without --data-dir the source is
+        # the default directory by definition; otherwise compare device and
+        # inode (two stat calls) instead of resolving every path component,
+        # falling back to canonical path strings if either does not exist
         default_data_dir = Path(config.DATA_DIR)
-        self.is_custom_path = (self.source_dir.resolve() != default_data_dir.resolve())
+        if not data_dir:
+            self.is_custom_path = False
+        else:
+            try:
+                self.is_custom_path = not os.path.samefile(self.source_dir, default_data_dir)
+            except OSError:
+                self.is_custom_path = (
+                    os.path.realpath(self.source_dir) != os.path.realpath(default_data_dir)
+                )
         
         # Set destination directory
         # Custom path: Copy TO project data/ directory
@@ -384,15 +851,44 @@ class DataMigrationManager:
         
         log.info(f"Custom path: {self.is_custom_path}")
         
+        # Directory listings shared by study detection and mapping build,
+        # so each source directory is scanned only once
+        self._scan_cache: Dict[str, Optional[Dict[str, bool]]] = {}
+        
         # Auto-detect study name from source dataset folder
-        self.study_name = extract_study_name(self.source_dir)
+        self.study_name = extract_study_name(self.source_dir, self._scan_source('dataset'))
         log.info(f"Study name determined: {self.study_name}")
         
-        # Define migration mappings (dynamically based on detected study name)
-        self.old_to_new = self._build_migration_mappings()
+        # Define migration mappings (dynamically based on detected study name).
+        # Re-runs on migrated data are the common case: one scandir of the
+        # study folder settles it, and the source listings are never read.
+        if self.is_already_migrated():
+            log.info("Skipping migration mappings: nothing to migrate")
+            self.old_to_new = {}
+            self._scan_cache.clear()
+        else:
+            self.old_to_new = self._build_migration_mappings()
+        
+        # Destination-side paths of each mapping, joined once for the
+        # confirmation, validation and cleanup steps
+        self._old_full_paths = [self.dest_dir / old_path for old_path in self.old_to_new.keys()]
+        self._new_full_paths = [self.dest_dir / new_path for new_path in self.old_to_new.values()]
         
         log.info(f"Migration Manager initialized (dry_run={dry_run}, custom_path={self.is_custom_path})")
     
+    def _scan_source(self, rel_path: str) -> Optional[Dict[str, bool]]:
+        """Return the (cached) _scan_dir() listing of a source subdirectory.
+        
+        Args:
+            rel_path: Directory relative to source_dir ('' for source_dir itself).
+        
+        Returns:
+            Entry name → is-directory mapping, or None if the directory is missing.
+        """
+        if rel_path not in self._scan_cache:
+            self._scan_cache[rel_path] = _scan_dir(self.source_dir / rel_path)
+        return self._scan_cache[rel_path]
+    
     def _build_migration_mappings(self) -> Dict[str, str]:
         """Build migration path mappings based on detected study name and actual folders.
         
@@ -430,20 +926,16 @@ class DataMigrationManager:
             Missing directories are skipped (allows partial migrations).
         """
         # Find actual subdirectories in dataset
-        dataset_dir = self.source_dir / 'dataset'
         dataset_subdir = None
-        if dataset_dir.exists():
-            subdirs = [d.name for d in dataset_dir.iterdir() if d.is_dir()]
-            if subdirs:
-                dataset_subdir = f'dataset/{subdirs[0]}'
+        subdir = _first_subdir(self._scan_source('dataset'))
+        if subdir is not None:
+            dataset_subdir = f'dataset/{subdir}'
         
         # Find actual subdirectories in Annotated_PDFs
-        annotated_dir = self.source_dir / 'Annotated_PDFs'
         annotated_subdir = None
-        if annotated_dir.exists():
-            subdirs = [d.name for d in annotated_dir.iterdir() if d.is_dir()]
-            if subdirs:
-                annotated_subdir = f'Annotated_PDFs/{subdirs[0]}'
+        subdir = _first_subdir(self._scan_source('Annotated_PDFs'))
+        if subdir is not None:
+            annotated_subdir = f'Annotated_PDFs/{subdir}'
         
         # Build mappings using standardized folder names (lowercase with underscores)
         mappings = {}
@@ -455,7 +947,7 @@ class DataMigrationManager:
             mappings[annotated_subdir] = f'{self.study_name}/annotated_pdfs'
         
         # Data dictionary mapping (usually at root level)
-        if (self.source_dir / 'data_dictionary_and_mapping_specifications').exists():
+        if 'data_dictionary_and_mapping_specifications' in (self._scan_source('') or {}):
             mappings['data_dictionary_and_mapping_specifications'] = f'{self.study_name}/data_dictionary'
         
         log.info(f"Built {len(mappings)} migration mappings:")
@@ -465,6 +957,14 @@ class DataMigrationManager:
             else:
                 log.info(f"  {old} → {new}")
         
+        # Remember what the scans established for validate_current_structure();
+        # every mapping key comes from an entry that was just listed
+        self._source_exists = self._scan_source('') is not None
+        self._existing_old_paths = set(mappings)
+        
+        # Listings go stale once files move; later calls rescan
+        self._scan_cache.clear()
+        
         return mappings
     
     def is_already_migrated(self) -> bool:
@@ -497,35 +997,154 @@ class DataMigrationManager:
         Note:
             Checks for ALL three subdirectories (datasets/, annotated_pdfs/,
             data_dictionary/). Partial migration is considered incomplete.
+            The result is cached per instance and reset by the steps that
+            create, fill or remove the study folder.
         """
-        # Check if study directory exists in destination
-        study_dir = self.dest_dir / self.study_name
+        # Reuse the last probe until a migration step changes the study folder
+        if self._already_migrated is not None:
+            return self._already_migrated
         
-        if not study_dir.exists():
-            return False
+        # One scandir of the study folder lists all of its children at once,
+        # instead of an exists() stat for the folder and each subdirectory
+        study_dir = self.dest_dir / self.study_name
+        study_entries = _scan_dir(study_dir)
         
-        # Check for new structure subdirectories
-        new_structure_dirs = ['datasets', 'annotated_pdfs', 'data_dictionary']
-        has_new_structure = all(
-            (study_dir / dirname).exists() 
-            for dirname in new_structure_dirs
+        has_new_structure = (
+            study_entries is not None
+            and _NEW_STRUCTURE_DIRS.issubset(study_entries)
         )
         
         if has_new_structure:
             log.info(f"✅ Data already in standardized format: {study_dir}")
+        
+        self._already_migrated = has_new_structure
+        return has_new_structure
+    
+    def _confirm(self, message: str) -> bool:
+        """Ask a yes/no question on stdin.
+        
+        Args:
+            message: Question to display.
+        
+        Returns:
+            True only if the user typed 'yes'.
+        """
+        response = input(f"\n{message} (type 'yes' to confirm): ")
+        return response.lower() == 'yes'
+    
+    def collect_confirmations(self) -> bool:
+        """Ask every confirmation question up front, before any file is touched.
+        
+        Gathers all answers in a single pre-flight block so the file phase of
+        the migration runs unattended instead of stalling on stdin between
+        steps. Answers are stored in self.confirmed:
+        
+        - 'proceed': Run the migration at all
+        - 'overwrite': Continue if the new study folder already exists
+        - 'continue_on_errors': Continue if some files fail to migrate
+        - 'cleanup_old': Remove the old directory structure afterwards
+        - 'cleanup_copied': Remove the copied study folder afterwards
+          (custom path mode only)
+        
+        With auto_confirm=True no prompts are shown: the migration proceeds
+        and overwrites, but stops on file failures and keeps the copied study
+        folder, since either of those would lose data the user asked to
+        migrate. The old structure is only removed automatically in default
+        path mode, where the moves have emptied it; in custom path mode it
+        lives in the project's data/ folder, was never migrated, and is
+        kept. With skip_cleanup=True both cleanup answers are "no" and their
+        questions are not asked.
+        
+        Returns:
+            True if the user agreed to proceed, False if cancelled.
+        
+        Example:
+            >>> manager = DataMigrationManager(auto_confirm=True)  # doctest: +SKIP
+            >>> manager.collect_confirmations()  # doctest: +SKIP
+            True
+            >>> manager.confirmed['cleanup_copied']  # doctest: +SKIP
+            False
+        """
+        new_base = self.dest_dir / self.study_name
+        old_paths = [full_path for full_path in self._old_full_paths if full_path.exists()]
+        
+        if self.auto_confirm:
+            self.confirmed = {
+                'proceed': True,
+                'overwrite': True,
+                'continue_on_errors': False,
+                # Custom path mode: data/'s old structure was not copied
+                # anywhere, so never delete it without asking
+                'cleanup_old': not self.skip_cleanup and not self.is_custom_path,
+                'cleanup_copied': False,
+            }
+            log.info("Confirmations accepted automatically (--yes)")
             return True
         
-        return False
+        self.confirmed = dict.fromkeys(
+            ('proceed', 'overwrite', 'continue_on_errors', 'cleanup_old', 'cleanup_copied'),
+            False
+        )
+        
+        if not self._confirm("Do you want to continue?"):
+            return False
+        self.confirmed['proceed'] = True
+        
+        if new_base.exists():
+            print(f"\n⚠️  New structure already exists: {new_base}")
+            if not self._confirm("Do you want to continue anyway?"):
+                self.confirmed['proceed'] = False
+                return False
+            self.confirmed['overwrite'] = True
+        
+        self.confirmed['continue_on_errors'] = self._confirm(
+            "Continue if some files fail to migrate?"
+        )
+        
+        if old_paths and not self.skip_cleanup:
+            print("\n" + "="*60)
+            print("⚠️  CLEANUP STEP 1: Old Directory Structure")
+            print("="*60)
+            if self.is_custom_path:
+                print("\nFound old structure in project's data/ folder.")
+                print("(This is separate from your custom source path)")
+            else:
+                print("\nDirectories to be removed (should be empty after file moves):")
+            for full_path in old_paths:
+                print(f"  - {full_path}")
+            print("="*60)
+            self.confirmed['cleanup_old'] = self._confirm(
+                "Remove old directory structure after migration?"
+            )
+        
+        if self.is_custom_path and not self.skip_cleanup:
+            print("\n" + "="*60)
+            print("⚠️  CLEANUP STEP 2: Newly Copied Study Folder")
+            print("="*60)
+            print(f"\nFiles will be copied from your custom path into:")
+            print(f"  - {new_base}")
+            print(f"\nYour original data at '{self.source_dir}' stays untouched.")
+            print("="*60)
+            self.confirmed['cleanup_copied'] = self._confirm(
+                f"Remove copied study folder '{self.study_name}' from project's data/ after migration?"
+            )
+        
+        return True
+    
+    def _is_confirmed(self, key: str) -> bool:
+        """Return the collected answer for a confirmation key (False if not collected)."""
+        return bool(self.confirmed and self.confirmed.get(key))
     
     def validate_current_structure(self) -> bool:
         """Validate that current structure exists and can be migrated.
         
         Performs comprehensive pre-migration validation:
         1. Checks source directory exists
-        2. Verifies at least one old structure path found
+        2. Verifies at least one old structure path found (with file counts
+           when verbose=True)
         3. Creates destination directory if needed (custom path mode)
         4. Warns if new structure already exists
-        5. Prompts user for confirmation if conflicts detected
+        5. Aborts on conflicts unless overwriting was confirmed up front
         
         Returns:
             True if structure valid and ready for migration, False otherwise.
@@ -533,7 +1152,7 @@ class DataMigrationManager:
         Side Effects:
             - Logs validation progress and results
             - May create destination directory (custom path mode)
-            - Prompts user for confirmation if new structure exists
+            - Checks the 'overwrite' confirmation if new structure exists
             - Logs file counts for each found path
         
         Raises:
@@ -548,23 +1167,34 @@ class DataMigrationManager:
             ...     print("Validation failed, aborting")
         
         Note:
-            Interactive - may prompt user for input if conflicts detected.
-            Returns False if user chooses not to continue.
+            Returns False if the new structure exists and overwriting was not
+            confirmed via collect_confirmations(). Dry runs only warn.
         """
         log.info("Validating current data structure...")
         
-        if not self.source_dir.exists():
+        source_exists = self._source_exists
+        if source_exists is None:
+            source_exists = self.source_dir.exists()
+        if not source_exists:
             log.error(f"Source directory not found: {self.source_dir}")
             return False
         
         # Check if old structure exists in source
         old_paths = []
+        existing = self._existing_old_paths
         for old_path in self.old_to_new.keys():
             full_path = self.source_dir / old_path
-            if full_path.exists():
+            if existing is not None:
+                found = old_path in existing
+            else:
+                found = full_path.exists()
+            if found:
                 old_paths.append(full_path)
-                file_count = len(list(full_path.rglob('*')))
-                log.info(f"✓ Found: {old_path} ({file_count} items)")
+                if self.verbose:
+                    file_count = _count_files(full_path)
+                    log.info(f"✓ Found: {old_path} ({file_count} files)")
+                else:
+                    log.info(f"✓ Found: {old_path}")
             else:
                 log.warning(f"✗ Not found: {old_path}")
         
@@ -587,9 +1217,8 @@ class DataMigrationManager:
         new_base = self.dest_dir / self.study_name
         if new_base.exists():
             log.warning(f"New structure already exists: {new_base}")
-            response = input("Do you want to continue anyway? (yes/no): ")
-            if response.lower() != 'yes':
-                log.info("Migration cancelled by user")
+            if not self.dry_run and not self._is_confirmed('overwrite'):
+                log.info("Migration cancelled: overwriting existing structure not confirmed")
                 return False
         
         log.info(f"✅ Validation complete: {len(old_paths)} paths ready for migration")
@@ -622,6 +1251,7 @@ class DataMigrationManager:
             times. Dry-run mode logs what would be created without changes.
         """
         log.info("Creating new directory structure...")
+        self._already_migrated = None
         
         new_dirs = [
             f'{self.study_name}/datasets',
@@ -639,7 +1269,7 @@ class DataMigrationManager:
             try:
                 full_path.mkdir(parents=True, exist_ok=True)
                 log.info(f"✓ Created: {full_path}")
-                self.migration_log.append(f"Created directory: {full_path}")
+                self._record_entry(f"Created directory: {full_path}")
             except Exception as e:
                 log.error(f"Failed to create {dir_path}: {e}")
                 return False
@@ -655,19 +1285,21 @@ class DataMigrationManager:
         **Custom Path Mode** (is_custom_path=True):
         - COPIES files from source to destination
         - Preserves originals at source location
-        - Uses shutil.copy2 (preserves metadata)
+        - Copies per file with copy2 semantics (preserves metadata), or
+          os.link when link_files=True and both trees share a filesystem
         
         **Default Path Mode** (is_custom_path=False):
         - MOVES files from old to new paths
         - DELETES originals after move (destructive!)
-        - Uses shutil.move
+        - Renames whole directories when on the same filesystem, otherwise
+          moves per file (os.replace, or copy2 + unlink across devices)
         
         For each old→new mapping:
-        1. Recursively finds all files in old path
+        1. Streams the files of the old path from an os.scandir walk
         2. Calculates relative paths for reorganization
         3. Creates destination directories as needed
-        4. Copies or moves each file with error handling
-        5. Logs progress every 10 files
+        4. Copies or moves files on a thread pool with error handling
+        5. Logs progress once per batch of 256 files
         6. Tracks successes, failures, and error messages
         
         Returns:
@@ -679,6 +1311,7 @@ class DataMigrationManager:
         Side Effects:
             - Creates directories in dest_dir
             - Copies or moves files (unless dry_run=True)
+            - Records files written per new path in files_per_new_path
             - Logs progress and completion status
             - Appends operations to migration_log
             - Updates file system (potentially destructive in default mode)
@@ -699,8 +1332,15 @@ class DataMigrationManager:
         Note:
             Preserves directory structure within each mapping. For example,
             if source has subdirectories, they're recreated in destination.
+            Both modes migrate the same file set from a given tree: the
+            _iter_files() walk follows symlinks to files but does not descend
+            into symlinked directories.
         """
         log.info("Starting file migration...")
+        self._already_migrated = None
+        self.files_per_new_path = {}
+        self._source_exists = None
+        self._existing_old_paths = None
         
         if self.is_custom_path:
             log.info(f"Custom path detected: Copying FROM {self.source_dir} TO {self.dest_dir}")
@@ -713,64 +1353,101 @@ class DataMigrationManager:
         files_failed = 0
         errors = []
         
-        for old_path, new_path in self.old_to_new.items():
-            source = self.source_dir / old_path
-            dest = self.dest_dir / new_path
-            
-            if not source.exists():
-                log.warning(f"Source not found, skipping: {source}")
-                continue
-            
-            operation = "Copying" if self.is_custom_path else "Moving"
-            if self.is_custom_path:
-                log.info(f"{operation}: {source} → {dest}")
-            else:
-                log.info(f"{operation}: {old_path} → {new_path}")
-            
-            # Get all files in source
-            if source.is_file():
-                files_to_process = [source]
-            else:
-                files_to_process = list(source.rglob('*'))
-                files_to_process = [f for f in files_to_process if f.is_file()]
-            
-            log.info(f"Found {len(files_to_process)} files to {operation.lower()}")
-            
-            for file_path in files_to_process:
-                # Calculate relative path
-                rel_path = file_path.relative_to(source)
-                dest_file = dest / rel_path
+        # Per-file dry-run lines are only built when DEBUG is enabled
+        debug_enabled = self.dry_run and log.get_logger().isEnabledFor(logging.DEBUG)
+        
+        # Hardlinking only works within one filesystem; probe once up front
+        use_links = (
+            self.is_custom_path and self.link_files and not self.dry_run
+            and os.stat(self.source_dir).st_dev == os.stat(self.dest_dir).st_dev
+        )
+        if use_links:
+            log.info("Source and destination share a filesystem: files will be hardlinked")
+        
+        # File copies and moves are I/O bound and release the GIL, so run
+        # them on thread pools and tally the results as they complete: a wide
+        # pool for small files and a narrow one for large copies
+        with ThreadPoolExecutor(max_workers=self.workers or _migration_workers()) as executor, \
+                ThreadPoolExecutor(max_workers=_LARGE_FILE_WORKERS) as large_executor:
+            for old_path, new_path in self.old_to_new.items():
+                source = self.source_dir / old_path
+                dest = self.dest_dir / new_path
+                
+                # One stat answers both "exists?" and "directory?"
+                try:
+                    source_is_dir = stat.S_ISDIR(os.stat(source).st_mode)
+                except FileNotFoundError:
+                    log.warning(f"Source not found, skipping: {source}")
+                    continue
+                
+                operation = "Copying" if self.is_custom_path else "Moving"
+                if self.is_custom_path:
+                    log.info(f"{operation}: {source} → {dest}")
+                else:
+                    log.info(f"{operation}: {old_path} → {new_path}")
+                
+                # Default path moves stay within data/, but the mapped folders
+                # may still be mount points; one device probe per mapping
+                # decides between rename and copy + unlink
+                cross_device = (
+                    not self.is_custom_path and not self.dry_run
+                    and os.stat(source).st_dev != os.stat(dest.parent).st_dev
+                )
+                if cross_device:
+                    log.warning(
+                        f"{old_path} is on a different filesystem than {new_path}: "
+                        "files will be copied and then deleted, which is much slower "
+                        "than a rename"
+                    )
+                
+                # Default path: rename the whole directory in one syscall when
+                # source and destination share a filesystem
+                if not self.is_custom_path and not self.dry_run and source_is_dir and not cross_device:
+                    renamed_count = self._rename_directory(source, dest)
+                    if renamed_count is not None:
+                        files_processed += renamed_count
+                        self.files_per_new_path[new_path] = renamed_count
+                        log.info(f"Moved {renamed_count} files via directory rename")
+                        self._record_entry(
+                            f"Moved (directory rename): {old_path} → {new_path} ({renamed_count} files)"
+                        )
+                        continue
                 
                 if self.dry_run:
-                    log.debug(f"[DRY RUN] Would {operation.lower()}: {file_path.name}")
-                    files_processed += 1
+                    file_count = 0
+                    operation_lower = operation.lower()
+                    for file_path, _rel_path, _entry in self._source_files(source, source_is_dir):
+                        if debug_enabled:
+                            log.debug("[DRY RUN] Would %s: %s", operation_lower, os.path.basename(file_path))
+                        file_count += 1
+                    log.info(f"[DRY RUN] Would {operation.lower()} {file_count} files")
+                    files_processed += file_count
+                    self.files_per_new_path[new_path] = file_count
                     continue
                 
-                try:
-                    # Create destination directory
-                    dest_file.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # Custom path: COPY files (preserve originals)
-                    # Default path: MOVE files (delete originals)
-                    if self.is_custom_path:
-                        shutil.copy2(str(file_path), str(dest_file))
-                        action = "Copied"
-                    else:
-                        shutil.move(str(file_path), str(dest_file))
-                        action = "Moved"
-                    
-                    files_processed += 1
-                    
-                    if files_processed % 10 == 0:
-                        log.info(f"Progress: {files_processed} files {action.lower()}...")
-                    
-                    self.migration_log.append(f"{action}: {old_path}/{rel_path} → {new_path}/{rel_path}")
-                    
-                except Exception as e:
-                    files_failed += 1
-                    error_msg = f"Failed to {operation.lower()} {file_path}: {e}"
-                    log.error(error_msg)
-                    errors.append(error_msg)
+                # Progress lines show a total only with --verbose: counting
+                # costs a second walk of the source before the transfers
+                total = None
+                if self.verbose:
+                    total = _count_files(source) if source_is_dir else 1
+                tracker = _TransferTracker(
+                    self._record_entry, old_path, new_path, operation, total
+                )
+                
+                # Both modes walk the source the same way and create each
+                # destination directory before any file is written into it
+                self._submit_files(
+                    executor, large_executor, tracker,
+                    self._source_files(source, source_is_dir),
+                    str(dest), use_links, cross_device
+                )
+                
+                processed, failed, transfer_errors = tracker.finish()
+                log.info(f"{processed} files {tracker.action_past}, {failed} failed: {old_path}")
+                files_processed += processed
+                self.files_per_new_path[new_path] = processed
+                files_failed += failed
+                errors.extend(transfer_errors)
         
         operation_past = "copied" if self.is_custom_path else "moved"
         log.info(f"✅ Migration complete: {files_processed} files {operation_past}, {files_failed} failed")
@@ -781,13 +1458,263 @@ class DataMigrationManager:
         
         return files_processed, files_failed, errors
     
+    def _copy_file(self, src: str, dst: str, use_links: bool,
+                   src_stat: Optional[os.stat_result] = None) -> str:
+        """Copy (or hardlink) a single file for custom path mode.
+        
+        A destination left by an earlier run is kept when its size and
+        modification time match the source (copies preserve mtime), so a
+        re-run after a partial migration only copies what changed.
+        
+        Args:
+            src: Source file path.
+            dst: Destination file path.
+            use_links: Try os.link() first, falling back to a copy.
+            src_stat: stat result for src, if the caller already has one.
+        
+        Returns:
+            Past-tense action for the migration log ("Unchanged", "Linked"
+            or "Copied").
+        """
+        try:
+            dst_stat = os.stat(dst)
+        except FileNotFoundError:
+            pass
+        else:
+            src_stat = src_stat or os.stat(src)
+            if (src_stat.st_size == dst_stat.st_size
+                    and src_stat.st_mtime_ns == dst_stat.st_mtime_ns):
+                return "Unchanged"
+        
+        if use_links:
+            try:
+                os.link(src, dst)
+                return "Linked"
+            except OSError:
+                pass
+        
+        _fast_copy(src, dst, src_stat)
+        return "Copied"
+    
+    @staticmethod
+    def _move_across_devices(src: str, dst: str,
+                             src_stat: Optional[os.stat_result] = None) -> str:
+        """Move a single file to another filesystem (default path mode).
+        
+        rename() cannot cross devices, so the file is copied with its
+        metadata and the original unlinked.
+        
+        Args:
+            src: Source file path.
+            dst: Destination file path.
+            src_stat: stat result for src, if the caller already has one.
+        
+        Returns:
+            Past-tense action for the migration log ("Moved").
+        """
+        _fast_copy(src, dst, src_stat)
+        os.unlink(src)
+        return "Moved"
+    
+    @staticmethod
+    def _source_files(source: Path,
+                      source_is_dir: bool) -> Iterator[Tuple[str, str, Optional[os.DirEntry]]]:
+        """Stream the files of one mapping with their scandir entries.
+        
+        Moving a file out of a directory that is still being listed is safe
+        here: only entries that scandir has already returned are removed, and
+        the destination never lies inside the source tree.
+        
+        Args:
+            source: Old-structure path of the mapping.
+            source_is_dir: Whether source is a directory (else a single file).
+        
+        Yields:
+            (absolute path, path relative to source, DirEntry) for every file.
+            The entry is None when source is a single file.
+        """
+        if not source_is_dir:
+            yield str(source), '', None
+            return
+        for entry, rel_path in _iter_files(source):
+            yield entry.path, rel_path, entry
+    
+    def _submit_files(self, executor: ThreadPoolExecutor, large_executor: ThreadPoolExecutor,
+                      tracker: '_TransferTracker',
+                      files: Iterator[Tuple[str, str, Optional[os.DirEntry]]],
+                      dest_str: str, use_links: bool,
+                      cross_device: bool) -> None:
+        """Transfer streamed files in batches, on the pool or inline.
+        
+        Files are taken from the walk in batches of _TRANSFER_BATCH_SIZE: the
+        batch's new destination directories are created in one sorted pass
+        (parents before children), then the whole batch is transferred. Plain
+        string paths are used throughout. Pool transfers are routed by the
+        size from the entry's cached stat and submitted in inode order.
+        
+        Args:
+            executor: Thread pool running the transfers.
+            large_executor: Narrow pool for files of _LARGE_FILE_MIN_SIZE or more.
+            tracker: Collects results for this mapping.
+            files: (source path, relative path, DirEntry) triples, typically
+                streamed from _source_files().
+            dest_str: Destination directory of the mapping.
+            use_links: Hardlink instead of copying (custom path mode only).
+            cross_device: Source and destination are on different filesystems.
+        """
+        # Same-device moves are one rename() each: cheaper to run inline than
+        # to pay the pool's queueing and wake-up cost per file. Copies and
+        # cross-device moves do real I/O and go to the thread pool.
+        inline = not self.is_custom_path and not cross_device
+        
+        # Copy vs move is fixed for the whole mapping: bind the worker
+        # function once instead of re-deciding it for every file.
+        # Custom path: COPY files (preserve originals)
+        # Default path: MOVE files (delete originals); only cross-device
+        # moves reach the pool
+        if self.is_custom_path:
+            transfer, transfer_args = self._copy_file, (use_links,)
+        else:
+            transfer, transfer_args = self._move_across_devices, ()
+        
+        def rename_inline(src: str, dst: str, entry: Optional[os.DirEntry]) -> str:
+            nonlocal inline
+            try:
+                os.replace(src, dst)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Same st_dev but different mounts (e.g. bind mounts): copy
+                # this file, and send the rest of the mapping to the pool
+                log.warning(f"Cross-device move detected at {src}: copying and deleting remaining files")
+                inline = False
+                return self._move_across_devices(
+                    src, dst, entry.stat() if entry is not None else None
+                )
+            return "Moved"
+        
+        made_dirs = set()
+        failed_dirs = {}
+        
+        while True:
+            batch = [
+                (file_path, rel_path, entry,
+                 os.path.join(dest_str, rel_path) if rel_path else dest_str)
+                for file_path, rel_path, entry in islice(files, _TRANSFER_BATCH_SIZE)
+            ]
+            if not batch:
+                break
+            
+            new_dirs = {os.path.dirname(dest_file) for *_, dest_file in batch} - made_dirs
+            for parent in sorted(new_dirs):
+                try:
+                    os.makedirs(parent, exist_ok=True)
+                except OSError as e:
+                    failed_dirs[parent] = e
+            made_dirs |= new_dirs
+            
+            for file_path, rel_path, entry, dest_file in batch:
+                dir_error = failed_dirs.get(os.path.dirname(dest_file))
+                if dir_error is not None:
+                    tracker.fail(file_path, dir_error)
+                elif inline:
+                    tracker.run(file_path, rel_path, rename_inline, file_path, dest_file, entry)
+                else:
+                    try:
+                        src_stat = entry.stat() if entry is not None else os.stat(file_path)
+                    except OSError as e:
+                        tracker.fail(file_path, e)
+                        continue
+                    pool = large_executor if src_stat.st_size >= _LARGE_FILE_MIN_SIZE else executor
+                    tracker.queue(
+                        pool, src_stat.st_ino, file_path, rel_path,
+                        transfer, file_path, dest_file, *transfer_args, src_stat
+                    )
+    
+    def _rename_directory(self, source: Path, dest: Path) -> Optional[int]:
+        """Move a whole mapped directory with a single os.replace() call.
+        
+        Renaming the directory is an O(1) inode operation, whereas moving its
+        contents file by file costs several syscalls per file. The caller only
+        tries it when source and destination share a filesystem; it succeeds
+        when the destination is missing or empty (as left by
+        create_new_structure()).
+        
+        Args:
+            source: Old-structure directory to move.
+            dest: New-structure directory to replace.
+        
+        Returns:
+            Number of files moved, or None if the rename was not possible
+            (e.g. non-empty destination) and the caller should fall back to
+            moving files individually. The destination directory exists
+            in that case.
+        """
+        # create_new_structure() leaves an empty destination behind. POSIX
+        # rename() replaces an empty directory but Windows refuses, so
+        # remove it first; rmdir() also fails fast on a non-empty destination
+        try:
+            os.rmdir(dest)
+        except FileNotFoundError:
+            os.makedirs(dest.parent, exist_ok=True)
+        except OSError as e:
+            log.debug(f"Destination {dest} not empty ({e}), moving files individually")
+            return None
+        
+        try:
+            os.replace(source, dest)
+        except OSError as e:
+            os.makedirs(dest, exist_ok=True)
+            log.debug(f"Directory rename not possible for {source} ({e}), moving files individually")
+            return None
+        
+        # Count after the rename, so a failed attempt costs no tree walk
+        return _count_files(dest)
+    
+    def _sync_destination(self) -> None:
+        """Flush migrated files to disk with a single filesystem-wide sync.
+        
+        Files are written without individual fsync() calls; this issues one
+        syncfs() on the destination filesystem (Linux) or sync() elsewhere on
+        POSIX once all transfers have finished. Failures are logged as
+        warnings since the data is already in the page cache.
+        
+        Note:
+            Dry-run mode skips the sync. Windows has no equivalent and is
+            left to the OS write-back.
+        """
+        if self.dry_run:
+            return
+        
+        try:
+            if sys.platform.startswith('linux'):
+                import ctypes
+                
+                fd = os.open(self.dest_dir, os.O_RDONLY)
+                try:
+                    libc = ctypes.CDLL(None, use_errno=True)
+                    if libc.syncfs(fd) != 0:
+                        err = ctypes.get_errno()
+                        raise OSError(err, os.strerror(err))
+                finally:
+                    os.close(fd)
+            elif hasattr(os, 'sync'):
+                os.sync()
+            else:
+                return
+            log.info(f"Synced migrated data to disk: {self.dest_dir}")
+        except (OSError, AttributeError) as e:
+            log.warning(f"Could not sync destination filesystem: {e}")
+    
     def validate_migration(self) -> bool:
         """Validate that migration was successful by checking file counts.
         
         Post-migration validation ensures data integrity:
         1. Verifies all new structure paths exist in destination
-        2. Counts files in each new path
-        3. Logs file counts for audit trail
+        2. Checks each new path holds files: paths move_files() wrote to
+           only need to exist, others are probed up to the first file, and
+           verbose=True counts all files
+        3. Logs file counts for audit trail (verbose only)
         4. Warns if any paths are empty (potential issue)
         
         Returns:
@@ -796,7 +1723,7 @@ class DataMigrationManager:
         
         Side Effects:
             - Logs validation progress and results
-            - Logs file counts for each migrated path
+            - Logs file counts for each migrated path (verbose only)
             - Logs warnings for empty directories
         
         Example:
@@ -821,18 +1748,30 @@ class DataMigrationManager:
         validation_passed = True
         
         # Check that new structure exists in destination and has files
-        for new_path in self.old_to_new.values():
-            full_path = self.dest_dir / new_path
-            
-            if not full_path.exists():
+        for new_path, full_path in zip(self.old_to_new.values(), self._new_full_paths):
+            # Exact counts need a full walk. Otherwise a path move_files()
+            # wrote files into needs only one stat, and other paths stop at
+            # the first file. The scandir itself reports a missing path.
+            try:
+                if self.verbose:
+                    file_count = _count_files(full_path)
+                    is_empty = file_count == 0
+                elif self.files_per_new_path.get(new_path, 0) > 0:
+                    os.stat(full_path)
+                    is_empty = False
+                else:
+                    is_empty = not _has_files(full_path)
+            except FileNotFoundError:
                 log.error(f"New path not found: {full_path}")
                 validation_passed = False
                 continue
             
-            file_count = len(list(full_path.rglob('*')))
-            log.info(f"✓ {full_path}: {file_count} items")
+            if self.verbose:
+                log.info(f"✓ {full_path}: {file_count} files")
+            else:
+                log.info(f"✓ {full_path}")
             
-            if file_count == 0:
+            if is_empty:
                 log.warning(f"Warning: {full_path} is empty")
         
         if validation_passed:
@@ -845,28 +1784,29 @@ class DataMigrationManager:
     def cleanup_old_structure(self) -> bool:
         """Remove old directory structure after successful migration.
         
-        Two-stage cleanup process with user confirmation at each stage:
+        Two-stage cleanup process, each stage gated by an answer gathered up
+        front by collect_confirmations():
         
         **Stage 1: Old Directory Structure Cleanup** (Both modes):
-        - Prompts user to remove old structure directories
+        - Requires the 'cleanup_old' confirmation
         - Checks if directories empty (should be after moves)
         - Warns if non-empty directories found
         - Removes old structure paths (dataset/, Annotated_PDFs/, etc.)
         
         **Stage 2: Copied Study Folder Cleanup** (Custom path mode only):
-        - Prompts to remove newly copied study folder from project data/
+        - Requires the 'cleanup_copied' confirmation to remove the newly
+          copied study folder from project data/
         - Confirms originals preserved at source location
         - Only applies if is_custom_path=True
         - Use case: Verify migration without keeping duplicate in project
         
-        Interactive prompts ensure user control over destructive operations.
+        Nothing is removed without an explicit confirmation.
         
         Returns:
-            True if cleanup completed successfully or user cancelled,
+            True if cleanup completed successfully or was not confirmed,
             False only on errors during file removal.
         
         Side Effects:
-            - Prompts user for confirmation (interactive)
             - Removes directories if confirmed (destructive!)
             - Logs cleanup operations
             - Appends operations to migration_log
@@ -882,90 +1822,60 @@ class DataMigrationManager:
         
         Warning:
             Destructive operation - removes directories permanently.
-            Dry-run mode skips cleanup (logs what would be prompted).
+            Dry-run mode skips cleanup.
         
         Note:
             User can decline cleanup - old structure preserved if desired.
             Useful for manual verification before permanent cleanup.
         """
         if self.dry_run:
-            log.info("[DRY RUN] Would prompt for cleanup")
+            log.info("[DRY RUN] Would clean up if confirmed")
             return True
         
         # STEP 1: Clean up old structure (applies to both default and custom paths)
-        old_structure_exists = any((self.dest_dir / old_path).exists() 
-                                   for old_path in self.old_to_new.keys())
-        
-        if old_structure_exists:
+        # Paths are removed without probing them first: whatever is already
+        # gone simply raises FileNotFoundError and is skipped
+        if self._is_confirmed('cleanup_old'):
             log.info("Cleaning up old directory structure...")
             
-            print("\n" + "="*60)
-            print("⚠️  CLEANUP STEP 1: Old Directory Structure")
-            print("="*60)
-            if self.is_custom_path:
-                print("\nFound old structure in project's data/ folder.")
-                print("(This is separate from your custom source path)")
-            else:
-                print("\nDirectories to be removed (should be empty after file moves):")
-            
-            for old_path in self.old_to_new.keys():
-                full_path = self.dest_dir / old_path
-                if full_path.exists():
-                    print(f"  - {full_path}")
-            print("="*60)
-            
-            response = input("\nRemove old directory structure? (type 'yes' to confirm): ")
-            
-            if response.lower() == 'yes':
-                for old_path in self.old_to_new.keys():
-                    full_path = self.dest_dir / old_path
-                    
-                    if not full_path.exists():
-                        continue
-                    
+            for old_path, full_path in zip(self.old_to_new.keys(), self._old_full_paths):
+                try:
+                    # Usually empty after moves: one rmdir() suffices
                     try:
-                        # Check if directory is empty (it should be after moves)
-                        if full_path.is_dir():
-                            remaining_items = list(full_path.rglob('*'))
-                            if remaining_items:
-                                log.warning(f"Directory not empty: {old_path} ({len(remaining_items)} items)")
-                        
-                        if full_path.is_file():
-                            full_path.unlink()
-                        else:
-                            shutil.rmtree(full_path)
-                        
-                        log.info(f"✓ Removed: {old_path}")
-                        self.migration_log.append(f"Removed old structure: {old_path}")
-                        
-                    except Exception as e:
-                        log.error(f"Failed to remove {old_path}: {e}")
-                        return False
+                        os.rmdir(full_path)
+                    except NotADirectoryError:
+                        os.unlink(full_path)
+                    except OSError as e:
+                        if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                            raise
+                        remaining_files = _count_files(full_path)
+                        if remaining_files:
+                            log.warning(f"Directory not empty: {old_path} ({remaining_files} files)")
+                        shutil.rmtree(full_path)
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    log.error(f"Failed to remove {old_path}: {e}")
+                    return False
                 
-                log.info("✅ Old structure cleanup complete")
-            else:
-                log.info("Old structure cleanup cancelled by user")
+                log.info(f"✓ Removed: {old_path}")
+                self._record_entry(f"Removed old structure: {old_path}")
+            
+            log.info("✅ Old structure cleanup complete")
+        elif any(full_path.exists() for full_path in self._old_full_paths):
+            log.info("Old structure retained (cleanup not confirmed)")
         
-        # STEP 2: For custom paths only - ask to remove newly copied study folder
+        # STEP 2: For custom paths only - remove newly copied study folder if confirmed
+        self._already_migrated = None
         if self.is_custom_path:
             study_dir = self.dest_dir / self.study_name
             
             if study_dir.exists():
-                print("\n" + "="*60)
-                print("⚠️  CLEANUP STEP 2: Newly Copied Study Folder")
-                print("="*60)
-                print(f"\nThe following folder was copied from your custom path:")
-                print(f"  - {study_dir}")
-                print(f"\nYour original data at '{self.source_dir}' is untouched.")
-                print("="*60)
-                
-                response = input(f"\nRemove copied study folder '{self.study_name}' from project's data/? (type 'yes' to confirm): ")
-                
-                if response.lower() == 'yes':
+                if self._is_confirmed('cleanup_copied'):
                     try:
                         shutil.rmtree(study_dir)
                         log.info(f"✓ Removed copied study folder: {self.study_name}")
-                        self.migration_log.append(f"Removed copied study: {self.study_name}")
+                        self._record_entry(f"Removed copied study: {self.study_name}")
                         print(f"\n✅ Removed: {study_dir}")
                         print(f"✅ Original data preserved at: {self.source_dir}")
                     except Exception as e:
@@ -978,21 +1888,83 @@ class DataMigrationManager:
         log.info("✅ Cleanup process complete")
         return True
     
+    def _record_entry(self, entry: str) -> None:
+        """Record one migration log entry.
+        
+        Entries are written straight to migration_log.txt through a large
+        buffer instead of accumulating in memory, so a migration of millions
+        of files keeps only the last _RECENT_LOG_ENTRIES in migration_log.
+        A log interrupted by a failed migration still records every step
+        taken up to that point.
+        
+        Args:
+            entry: Operation description, e.g. "Moved: a/b.csv → X/datasets/b.csv".
+        """
+        self.migration_log.append(entry)
+        if self.dry_run or self._log_failed:
+            return
+        if self._log_fh is None and not self._open_migration_log():
+            return
+        try:
+            self._log_fh.write(f"{entry}\n")
+        except OSError as e:
+            log.error(f"Failed to write migration log: {e}")
+            self._close_migration_log()
+            self._log_failed = True
+    
+    def _open_migration_log(self) -> bool:
+        """Create migration_log.txt in dest_dir and write its header.
+        
+        Returns:
+            True if the log file is open for writing.
+        """
+        log_file = self.dest_dir / 'migration_log.txt'
+        header = (
+            f"Data Migration Log\n"
+            f"{'='*60}\n"
+            f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"Study: {self.study_name}\n\n"
+            f"Migration Steps:\n"
+            f"{'-'*60}\n"
+        )
+        try:
+            self._log_fh = open(log_file, 'w', buffering=_MIGRATION_LOG_BUFFER)
+            self._log_fh.write(header)
+        except OSError as e:
+            log.error(f"Failed to create migration log: {e}")
+            self._close_migration_log()
+            self._log_failed = True
+            return False
+        return True
+    
+    def _close_migration_log(self) -> None:
+        """Flush and close the streamed migration log, if open."""
+        if self._log_fh is None:
+            return
+        try:
+            self._log_fh.close()
+        except OSError as e:
+            log.error(f"Failed to save migration log: {e}")
+            self._log_failed = True
+        self._log_fh = None
+    
     def save_migration_log(self) -> None:
         """Save migration operation log to file for audit trail.
         
-        Creates migration_log.txt in destination directory with:
+        migration_log.txt in the destination directory holds:
         - Timestamp
         - Study name
         - List of all operations performed (creates, copies, moves, removes)
         
-        Log file serves as permanent record of migration for troubleshooting
-        and compliance auditing.
+        Entries are streamed to the file as they happen (see
+        _record_entry()); this flushes and closes it, creating it first if
+        no operation was recorded. Log file serves as permanent record of
+        migration for troubleshooting and compliance auditing.
         
         Side Effects:
             - Creates migration_log.txt in dest_dir (unless dry_run=True)
             - Logs save status
-            - Overwrites existing log file if present
+            - Overwrites an existing log file from an earlier run
         
         Example:
             >>> from pathlib import Path
@@ -1010,24 +1982,12 @@ class DataMigrationManager:
             log.info("[DRY RUN] Would save migration log")
             return
         
-        log_file = self.dest_dir / 'migration_log.txt'
+        if self._log_fh is None and not self._log_failed:
+            self._open_migration_log()
+        self._close_migration_log()
         
-        try:
-            with open(log_file, 'w') as f:
-                f.write(f"Data Migration Log\n")
-                f.write(f"{'='*60}\n")
-                f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Study: {self.study_name}\n\n")
-                
-                f.write("Migration Steps:\n")
-                f.write("-" * 60 + "\n")
-                for entry in self.migration_log:
-                    f.write(f"{entry}\n")
-            
-            log.info(f"Migration log saved: {log_file}")
-            
-        except Exception as e:
-            log.error(f"Failed to save migration log: {e}")
+        if not self._log_failed:
+            log.info(f"Migration log saved: {self.dest_dir / 'migration_log.txt'}")
     
     def migrate(self) -> bool:
         """Execute complete migration workflow from validation to cleanup.
@@ -1037,13 +1997,14 @@ class DataMigrationManager:
         **Step 0**: Check if already migrated (idempotent)
         **Step 1**: Validate current structure exists
         **Step 2**: Create new directory structure
-        **Step 3**: Copy or move files (mode-dependent)
+        **Step 3**: Copy or move files (mode-dependent), then sync to disk
         **Step 4**: Validate migration success
         **Step 5**: Optional cleanup with user confirmation
         **Step 6**: Save migration log
         
         Provides comprehensive logging at each step with clear success/failure
-        indicators. Handles errors gracefully with user prompts for recovery.
+        indicators. Error recovery and cleanup follow the answers gathered by
+        collect_confirmations() before any file is touched.
         
         Returns:
             True if migration completed successfully, False on any failure
@@ -1052,7 +2013,7 @@ class DataMigrationManager:
         Side Effects:
             - Executes all migration operations (unless dry_run=True)
             - Logs comprehensive progress and results
-            - May prompt user for decisions (cleanup, error recovery)
+            - Prompts for all confirmations up front if not yet collected
             - Updates migration_success flag
             - Creates/modifies file system structure
         
@@ -1080,6 +2041,21 @@ class DataMigrationManager:
             structure and skips redundant work. Dry-run mode recommended for
             testing before actual migration.
         """
+        try:
+            return self._run_migration()
+        finally:
+            # The log is opened by the first recorded step; close it on every
+            # exit path (aborts and exceptions too), keeping the record of
+            # what was already done
+            self._close_migration_log()
+    
+    def _run_migration(self) -> bool:
+        """Run the migration steps for migrate().
+        
+        Returns:
+            True if migration completed successfully, False on any failure
+            or user cancellation.
+        """
         log.info("="*60)
         log.info("Starting Data Structure Migration")
         log.info("="*60)
@@ -1101,6 +2077,11 @@ class DataMigrationManager:
             log.info("No migration needed. Exiting.")
             return True
         
+        # Ask all questions before any file is touched (unless main() already did)
+        if not self.dry_run and self.confirmed is None and not self.collect_confirmations():
+            log.info("Migration cancelled by user")
+            return False
+        
         # Step 1: Validate current structure
         if not self.validate_current_structure():
             log.error("❌ Validation failed. Migration aborted.")
@@ -1113,15 +2094,15 @@ class DataMigrationManager:
         
         # Step 3: Copy or Move files
         files_processed, files_failed, errors = self.move_files()
+        self._sync_destination()
         
         if files_failed > 0:
             log.error(f"❌ {files_failed} files failed to process")
             for error in errors[:10]:  # Show first 10 errors
                 log.error(f"  {error}")
             
-            response = input("\nContinue despite errors? (yes/no): ")
-            if response.lower() != 'yes':
-                log.info("Migration aborted by user")
+            if not self._is_confirmed('continue_on_errors'):
+                log.info("Migration aborted: continuing despite errors not confirmed")
                 return False
         
         # Step 4: Validate migration
@@ -1169,11 +2150,18 @@ def main():
     **Command-Line Arguments:**
         --dry-run: Simulate migration without making changes (recommended first)
         --data-dir: Path to custom source data directory (optional)
+        -y/--yes: Answer confirmation prompts automatically (or set
+            MIGRATION_AUTO_CONFIRM=true)
+        --no-cleanup: Keep the old structure and copied folder, skip cleanup questions
+        --jobs N: Number of parallel file transfers
+        -v/--verbose: Log exact file counts during validation and progress totals
+        --link: Hardlink instead of copy from --data-dir (same filesystem only)
     
     **Safety Features:**
     - Displays WARNING about no backup creation
     - Explains file operations (move vs copy)
-    - Requires explicit 'yes' confirmation for actual migration
+    - Requires explicit 'yes' confirmation for actual migration, asking
+      every question once before any file is touched (or --yes)
     - Dry-run mode available for risk-free testing
     
     **Exit Codes:**
@@ -1209,7 +2197,8 @@ def main():
         --dry-run first!
     
     Note:
-        Interactive - prompts for user confirmation unless --dry-run used.
+        Interactive - prompts for user confirmation unless --dry-run or
+        --yes (MIGRATION_AUTO_CONFIRM=true) is used.
         Safe to run multiple times - detects if already migrated.
     """
     
@@ -1227,11 +2216,49 @@ def main():
         type=str,
         help='Path to data directory (default: from config)'
     )
+    parser.add_argument(
+        '-y', '--yes',
+        action='store_true',
+        help='Answer confirmation prompts automatically (unattended migration); '
+             'also enabled by MIGRATION_AUTO_CONFIRM=true'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        metavar='N',
+        help='Number of parallel file transfers (default: MIGRATION_WORKERS or 4 per CPU, max 32)'
+    )
+    parser.add_argument(
+        '--no-cleanup',
+        action='store_true',
+        help='Keep the old structure (and copied study folder) without asking'
+    )
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Log exact file counts during validation and totals in progress lines (walks every tree)'
+    )
+    parser.add_argument(
+        '--link',
+        action='store_true',
+        help='Hardlink instead of copying files from --data-dir when on the same filesystem'
+    )
     
     args = parser.parse_args()
     
-    # Display warning about no backups
-    if not args.dry_run:
+    # Initialize migration manager
+    manager = DataMigrationManager(
+        data_dir=args.data_dir,
+        dry_run=args.dry_run,
+        link_files=args.link,
+        auto_confirm=args.yes or os.getenv('MIGRATION_AUTO_CONFIRM', '').lower() == 'true',
+        skip_cleanup=args.no_cleanup,
+        workers=max(1, args.jobs) if args.jobs else None,
+        verbose=args.verbose
+    )
+    
+    # Display warning about no backups (nothing to ask if already migrated)
+    if not args.dry_run and not manager.is_already_migrated():
         print("\n" + "="*60)
         print("⚠️  WARNING: MIGRATION MOVES FILES (NO BACKUP CREATED)")
         print("="*60)
@@ -1242,17 +2269,11 @@ def main():
         print("\nEnsure you have external backups before proceeding!")
         print("="*60)
         
-        response = input("\nDo you want to continue? (type 'yes' to confirm): ")
-        if response.lower() != 'yes':
+        # Single pre-flight prompt block; the migration then runs unattended
+        if not manager.collect_confirmations():
             print("Migration cancelled.")
             sys.exit(0)
     
-    # Initialize migration manager
-    manager = DataMigrationManager(
-        data_dir=args.data_dir,
-        dry_run=args.dry_run
-    )
-    
     # Execute migration
     success = manager.migrate()
     
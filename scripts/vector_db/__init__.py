@@ -78,33 +78,35 @@ See Also:
     main.py: Uses --ingest-pdfs and --ingest-records flags
 """
 
-# Lazy imports for performance
+from importlib import import_module
+
+# Lazy imports for performance: public name -> defining submodule
+_LAZY_IMPORTS = {
+    "EmbeddingModel": ".embeddings",
+    "AdaptiveEmbedder": ".adaptive_embeddings",
+    "ModelType": ".adaptive_embeddings",
+    "TextChunker": ".jsonl_chunking_nl",
+    "PDFChunker": ".pdf_chunking",
+    "VectorStore": ".vector_store",
+}
+
+# Placeholders for future implementation
+_NOT_IMPLEMENTED = frozenset({"IngestionPipeline", "search_dual_db"})
+
+
 def __getattr__(name):
-    """Lazy load modules on first access."""
-    if name == "EmbeddingModel":
-        from .embeddings import EmbeddingModel
-        return EmbeddingModel
-    elif name == "AdaptiveEmbedder":
-        from .adaptive_embeddings import AdaptiveEmbedder
-        return AdaptiveEmbedder
-    elif name == "ModelType":
-        from .adaptive_embeddings import ModelType
-        return ModelType
-    elif name == "TextChunker":
-        from .jsonl_chunking_nl import TextChunker
-        return TextChunker
-    elif name == "PDFChunker":
-        from .pdf_chunking import PDFChunker
-        return PDFChunker
-    elif name == "VectorStore":
-        from .vector_store import VectorStore
-        return VectorStore
-    elif name == "IngestionPipeline":
-        # Placeholder for future implementation
-        raise NotImplementedError("IngestionPipeline not yet implemented")
-    elif name == "search_dual_db":
-        # Placeholder for future implementation
-        raise NotImplementedError("search_dual_db not yet implemented")
+    """Lazy load modules on first access.
+    
+    The loaded object is stored in the module globals, so later accesses
+    find it directly and no longer go through this hook.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is not None:
+        value = getattr(import_module(module_name, __name__), name)
+        globals()[name] = value
+        return value
+    if name in _NOT_IMPLEMENTED:
+        raise NotImplementedError(f"{name} not yet implemented")
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Expose main components for easy import
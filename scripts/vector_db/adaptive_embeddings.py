@@ -148,6 +148,7 @@ Note:
     matching) and adds negligible overhead (<1ms per text).
 """
 
+import re
 import time
 import warnings
 from pathlib import Path
@@ -167,6 +168,14 @@ except ImportError:
         "Install with: pip install sentence-transformers"
     )
 
+# Aho-Corasick automaton for keyword detection (optional; a compiled regex
+# is used when pyahocorasick is not installed)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Import model constants from embeddings module (avoid duplication)
 from .embeddings import EmbeddingModel
 from scripts.utils import logging_system as log
@@ -498,6 +507,7 @@ class AdaptiveEmbedder:
         self.medical_keywords = self._get_default_medical_keywords()
         if medical_keywords:
             self.medical_keywords.update(kw.lower() for kw in medical_keywords)
+        self._build_keyword_matcher()
         
         # Load models using EmbeddingModel wrapper (eliminates code duplication)
         logger.info("Initializing adaptive embedder...")
@@ -623,6 +633,34 @@ class AdaptiveEmbedder:
             "baseline", "enrollment", "consent", "eligibility"
         }
     
+    def _build_keyword_matcher(self) -> None:
+        """Compile medical_keywords into a single substring matcher.
+        
+        Builds an Aho-Corasick automaton when pyahocorasick is installed,
+        otherwise one precompiled regex alternation. Either way a token is
+        checked against every keyword in a single C-level scan instead of a
+        Python loop over the keyword set.
+        
+        Side Effects:
+            - Sets self._keyword_matcher, a callable returning a truthy value
+              when its argument contains any medical keyword
+        
+        Note:
+            Called from __init__ and add_medical_keywords(); rebuild it after
+            modifying self.medical_keywords directly.
+        """
+        if not self.medical_keywords:
+            self._keyword_matcher = lambda token: False
+        elif AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.medical_keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._keyword_matcher = lambda token: next(automaton.iter(token), None)
+        else:
+            pattern = re.compile('|'.join(map(re.escape, self.medical_keywords)))
+            self._keyword_matcher = pattern.search
+    
     def detect_query_type(self, text: str) -> Tuple[QueryType, float]:
         """Detect content type (medical/general/mixed) via keyword ratio analysis.
         
@@ -676,7 +714,9 @@ class AdaptiveEmbedder:
         Note:
             Uses substring matching (not exact match). E.g., 'tuberculosis' matches
             'anti-tuberculosis', 'tuberculosis-related'. Case-insensitive. Simple
-            whitespace tokenization (no linguistic processing). Very fast (<1ms).
+            whitespace tokenization (no linguistic processing). Each token is
+            checked against all keywords in one pass of a precompiled matcher
+            (Aho-Corasick if pyahocorasick is installed). Very fast (<1ms).
         """
         if not text or not text.strip():
             return QueryType.UNKNOWN, 0.0
@@ -686,11 +726,9 @@ class AdaptiveEmbedder:
         if not tokens:
             return QueryType.UNKNOWN, 0.0
         
-        # Count medical keywords
-        medical_count = sum(
-            1 for token in tokens
-            if any(keyword in token for keyword in self.medical_keywords)
-        )
+        # Count tokens containing a medical keyword
+        matcher = self._keyword_matcher
+        medical_count = sum(1 for token in tokens if matcher(token))
         
         # Calculate ratio
         medical_ratio = medical_count / len(tokens)
@@ -1018,6 +1056,7 @@ class AdaptiveEmbedder:
             No need to add plural forms separately. Changes take effect immediately.
         """
         self.medical_keywords.update(kw.lower() for kw in keywords)
+        self._build_keyword_matcher()
         logger.info(f"Added {len(keywords)} medical keywords")
     
     def get_model_info(self) -> Dict[str, Any]:
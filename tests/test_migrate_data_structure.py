@@ -0,0 +1,66 @@
+"""Tests for scripts.utils.migrate_data_structure.
+
+Covers unattended (auto-confirmed) migrations from a custom data path,
+which must never remove the old structure inside the project's data/
+folder: that data is separate from the custom source and is not migrated.
+"""
+
+import builtins
+import sys
+from pathlib import Path
+
+import pytest
+
+import config
+from scripts.utils import migrate_data_structure as mig
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture
+def custom_layout(tmp_path, monkeypatch):
+    """Custom source tree plus a project data/ folder holding old-structure data."""
+    source = tmp_path / 'source'
+    data_dir = tmp_path / 'data'
+    _write(source / 'dataset' / 'Indo-vap_csv_files' / 'a.xlsx', 'a')
+    _write(source / 'Annotated_PDFs' / 'annotated_pdfs' / 'x.pdf', 'pdf')
+    _write(source / 'data_dictionary_and_mapping_specifications' / 'map.xlsx', 'map')
+    old_file = data_dir / 'dataset' / 'Indo-vap_csv_files' / 'keep.xlsx'
+    _write(old_file, 'keep')
+
+    monkeypatch.setattr(config, 'DATA_DIR', str(data_dir))
+
+    def no_prompts(*args, **kwargs):
+        raise AssertionError(f"unexpected prompt: {args}")
+    monkeypatch.setattr(builtins, 'input', no_prompts)
+
+    return source, data_dir, old_file
+
+
+def test_auto_confirm_keeps_old_structure_in_custom_mode(custom_layout):
+    source, data_dir, old_file = custom_layout
+
+    manager = mig.DataMigrationManager(data_dir=str(source), auto_confirm=True)
+
+    assert manager.is_custom_path
+    assert manager.migrate()
+    assert manager.confirmed['cleanup_old'] is False
+    assert (data_dir / 'Indo-VAP' / 'datasets' / 'a.xlsx').read_text() == 'a'
+    assert old_file.read_text() == 'keep'
+    assert (source / 'dataset' / 'Indo-vap_csv_files' / 'a.xlsx').exists()
+
+
+def test_env_auto_confirm_keeps_old_structure_in_custom_mode(custom_layout, monkeypatch):
+    source, data_dir, old_file = custom_layout
+    monkeypatch.setenv('MIGRATION_AUTO_CONFIRM', 'true')
+    monkeypatch.setattr(sys, 'argv', ['migrate_data_structure.py', '--data-dir', str(source)])
+
+    with pytest.raises(SystemExit) as exit_info:
+        mig.main()
+
+    assert exit_info.value.code == 0
+    assert (data_dir / 'Indo-VAP' / 'datasets' / 'a.xlsx').read_text() == 'a'
+    assert old_file.read_text() == 'keep'